@@ -0,0 +1,114 @@
+"""
+Technical indicators over candle arrays, compiled with Numba.
+
+Indicators take a float64 column of `CandlesPage.as_numpy()`, in chronological
+order (the API returns candles newest first), e.g.:
+
+    candles = client.get_product_candles(..., as_array=True).as_numpy()[::-1]
+    sma(candles['close'], 20)
+
+Functions are compiled for their pinned signatures at import time and cached
+on disk. Requires the `analytics` extra (`pip install coinbaseadvanced[analytics]`).
+"""
+
+import numpy as np
+from numba import njit
+
+# Float re-association lets reductions vectorize; NaN/inf semantics are kept.
+_FASTMATH = {'reassoc', 'contract', 'arcp'}
+
+
+@njit('float64[:](float64[:], int64)', cache=True, fastmath=_FASTMATH)
+def sma(values, window):
+    """
+    Simple moving average over `window` values.
+    The first `window - 1` entries are NaN.
+    """
+
+    size = values.shape[0]
+    result = np.full(size, np.nan)
+
+    if window <= 0 or window > size:
+        return result
+
+    total = 0.0
+    for i in range(size):
+        total += values[i]
+        if i >= window:
+            total -= values[i - window]
+        if i >= window - 1:
+            result[i] = total / window
+
+    return result
+
+
+@njit('float64[:](float64[:], int64)', cache=True, fastmath=_FASTMATH)
+def ema(values, window):
+    """
+    Exponential moving average with smoothing `2 / (window + 1)`, seeded with
+    the simple average of the first `window` values.
+    The first `window - 1` entries are NaN.
+    """
+
+    size = values.shape[0]
+    result = np.full(size, np.nan)
+
+    if window <= 0 or window > size:
+        return result
+
+    alpha = 2.0 / (window + 1)
+
+    total = 0.0
+    for i in range(window):
+        total += values[i]
+    average = total / window
+    result[window - 1] = average
+
+    for i in range(window, size):
+        average += alpha * (values[i] - average)
+        result[i] = average
+
+    return result
+
+
+@njit('float64[:](float64[:], int64)', cache=True, fastmath=_FASTMATH)
+def rsi(values, period):
+    """
+    Relative Strength Index using Wilder's smoothing over `period` changes.
+    The first `period` entries are NaN; windows without any movement are neutral (50).
+    """
+
+    size = values.shape[0]
+    result = np.full(size, np.nan)
+
+    if period <= 0 or period >= size:
+        return result
+
+    gains = 0.0
+    losses = 0.0
+    for i in range(1, period + 1):
+        change = values[i] - values[i - 1]
+        if change > 0:
+            gains += change
+        else:
+            losses -= change
+
+    average_gain = gains / period
+    average_loss = losses / period
+
+    for i in range(period, size):
+        if i > period:
+            change = values[i] - values[i - 1]
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            average_gain = (average_gain * (period - 1) + gain) / period
+            average_loss = (average_loss * (period - 1) + loss) / period
+
+        if average_gain == 0 and average_loss == 0:
+            result[i] = 50.0
+        elif average_loss == 0:
+            result[i] = 100.0
+        else:
+            result[i] = 100.0 - 100.0 / (1.0 + average_gain / average_loss)
+
+    return result
@@ -2,22 +2,74 @@
 API Client for Coinbase Advanced Trade endpoints.
 """
 
-import hashlib
-import hmac
-import json
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List
+from typing import Callable, Iterator, List
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-
+from coinbaseadvanced import _signing
 from coinbaseadvanced.models.fees import TransactionsSummary
 from coinbaseadvanced.models.products import ProductsPage, Product, CandlesPage,\
-    TradesPage, ProductType, Granularity, GRANULARITY_MAP_IN_MINUTES
+    TradesPage, ProductType, Granularity, GRANULARITY_MAP_IN_MINUTES, GRANULARITY_VALUES, PRODUCT_TYPE_VALUES
 from coinbaseadvanced.models.accounts import AccountsPage, Account
 from coinbaseadvanced.models.orders import OrderPlacementSource, OrdersPage, Order,\
-    OrderBatchCancellation, FillsPage, Side, StopDirection, OrderType
+    OrderBatchCancellation, FillsPage, Fill, Side, StopDirection, OrderType, SIDE_VALUES, ORDER_TYPE_VALUES
+
+
+# Seconds closed candle responses are served from the client cache.
+CLOSED_CANDLES_CACHE_TTL = float('inf')
+
+# Largest number of order ids sent in a single batch cancel request.
+CANCEL_ORDERS_MAX_BATCH = 100
+
+
+def _format_datetime(value: datetime) -> str:
+    """
+    Format `value` as the `%Y-%m-%dT%H:%M:%SZ` timestamps the API expects.
+    `isoformat` runs in C without re-parsing a format string on every call.
+    """
+
+    return value.replace(tzinfo=None).isoformat(timespec='seconds') + 'Z'
+
+
+class _RateLimiter(object):
+    """
+    Thread-safe token bucket pacing requests before they are sent, so bursts
+    are throttled client side instead of being answered with 429 errors.
+    """
+
+    def __init__(self, rate: float = 5, burst: int = 10) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Take one token, sleeping until one is available if the bucket is empty.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+            self._tokens = 0.0
+            self._last = now + wait
 
 
 class CoinbaseAdvancedTradeAPIClient(object):
@@ -25,15 +77,68 @@ class CoinbaseAdvancedTradeAPIClient(object):
     API Client for Coinbase Advanced Trade endpoints.
     """
 
+    # Extra headers sent with every JSON request body.
+    _JSON_HEADERS = {'Content-Type': 'application/json'}
+
     def __init__(self,
                  api_key: str,
                  secret_key: str,
                  base_url: str = 'https://api.coinbase.com',
-                 timeout: int = 10) -> None:
+                 timeout: int = 10,
+                 cache_size: int = 256,
+                 products_cache_ttl: float = 0,
+                 max_workers: int = 4) -> None:
         self._base_url = base_url
         self._api_key = api_key
         self._secret_key = secret_key
         self.timeout = timeout
+        self._secret_bytes = secret_key.encode('utf-8')
+
+        # Single pooled session so repeated calls reuse the same TCP/TLS connection.
+        self._session = requests.Session()
+        # Only idempotent methods are retried; 429/503 wait for the Retry-After header.
+        # Once retries run out the last response is returned, not raised, so the
+        # API error body still reaches `CoinbaseAdvancedTradeAPIError`.
+        retries = Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504],
+                        respect_retry_after_header=True, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        # Coinbase private endpoints allow 5 requests/second sustained, 10 in bursts.
+        self._limiter = _RateLimiter(rate=5, burst=10)
+
+        # LRU of (request_path, params) -> (expiry, response) for quasi-static data.
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        # Product responses carry live prices and status, so they are only cached on request.
+        self._products_cache_ttl = products_cache_ttl
+        self._cache_lock = threading.Lock()
+
+        # Worker pool for requests dispatched concurrently, sharing the pooled session.
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def close(self) -> None:
+        """
+        Release the pooled connections and worker threads held by the client.
+        """
+
+        self._executor.shutdown()
+        self._session.close()
+
+    def clear_cache(self) -> None:
+        """
+        Drop every cached response, e.g. after a product listing change.
+        """
+
+        with self._cache_lock:
+            self._cache.clear()
+
+    def __enter__(self) -> 'CoinbaseAdvancedTradeAPIClient':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
 
     # Accounts #
 
@@ -56,16 +161,12 @@ class CoinbaseAdvancedTradeAPIClient(object):
 
         request_path = '/api/v3/brokerage/accounts'
         method = "GET"
-        query_params = '?limit='+str(limit)
+        params = {'limit': limit}
 
         if cursor is not None:
-            query_params = query_params + '&cursor='+cursor
+            params['cursor'] = cursor
 
-        headers = self._build_request_headers(method, request_path)
-
-        response = requests.get(self._base_url+request_path+query_params,
-                                headers=headers,
-                                timeout=self.timeout)
+        response = self._request(method, request_path, params=params)
 
         page = AccountsPage.from_response(response)
         return page
@@ -78,11 +179,13 @@ class CoinbaseAdvancedTradeAPIClient(object):
         increased to the maximum coinbase allows.
         """
 
-        full_page = AccountsPage([], has_next=True, cursor=cursor, size=0)
+        full_page = AccountsPage([], has_next=False, cursor=cursor, size=0)
+
+        pages = self._fetch_pages_concurrent(
+            lambda page_cursor: self.list_accounts(limit, cursor=page_cursor), cursor)
 
-        # if there are more accounts to request, do so
-        while full_page.has_next:
-            page = self.list_accounts(limit, cursor=full_page.cursor)
+        # the next page is already being requested while this one is merged
+        for page in pages:
             # update the statistics and transfer the cursor and has_next flag
             full_page.size += page.size
             full_page.cursor = page.cursor
@@ -92,6 +195,20 @@ class CoinbaseAdvancedTradeAPIClient(object):
 
         return full_page
 
+    def iter_accounts(self, limit: int = 250, cursor: str = None) -> Iterator[Account]:
+        """
+        Iterate over all authenticated accounts for the current user.
+
+        Pages are requested lazily; the next page is fetched in the background
+        while the accounts of the current one are being consumed.
+        """
+
+        pages = self._fetch_pages_concurrent(
+            lambda page_cursor: self.list_accounts(limit, cursor=page_cursor), cursor)
+
+        for page in pages:
+            yield from page.accounts
+
     def get_account(self, account_id: str) -> Account:
         """
         https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_getaccount
@@ -106,9 +223,7 @@ class CoinbaseAdvancedTradeAPIClient(object):
         request_path = f"/api/v3/brokerage/accounts/{account_id}"
         method = "GET"
 
-        headers = self._build_request_headers(method, request_path)
-
-        response = requests.get(self._base_url+request_path, headers=headers, timeout=self.timeout)
+        response = self._request(method, request_path)
 
         account = Account.from_response(response)
         return account
@@ -196,7 +311,7 @@ class CoinbaseAdvancedTradeAPIClient(object):
             limit_order_configuration['post_only'] = post_only
 
         if cancel_time is not None:
-            limit_order_configuration['end_time'] = cancel_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+            limit_order_configuration['end_time'] = _format_datetime(cancel_time)
             order_configuration['limit_limit_gtd'] = limit_order_configuration
         else:
             order_configuration['limit_limit_gtc'] = limit_order_configuration
@@ -244,7 +359,7 @@ class CoinbaseAdvancedTradeAPIClient(object):
         }
 
         if cancel_time is not None:
-            stop_limit_order_configuration['end_time'] = cancel_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+            stop_limit_order_configuration['end_time'] = _format_datetime(cancel_time)
             order_configuration['stop_limit_stop_limit_gtd'] = stop_limit_order_configuration
         else:
             order_configuration['stop_limit_stop_limit_gtc'] = stop_limit_order_configuration
@@ -272,14 +387,11 @@ class CoinbaseAdvancedTradeAPIClient(object):
         payload = {
             'client_order_id': client_order_id,
             'product_id': product_id,
-            'side': side.value,
+            'side': SIDE_VALUES.get(side, side),
             'order_configuration': order_configuration
         }
 
-        headers = self._build_request_headers(method, request_path, json.dumps(payload))
-        response = requests.post(self._base_url+request_path,
-                                 json=payload, headers=headers,
-                                 timeout=self.timeout)
+        response = self._request(method, request_path, body=payload)
 
         order = Order.from_create_order_response(response)
         return order
@@ -289,11 +401,43 @@ class CoinbaseAdvancedTradeAPIClient(object):
         https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_cancelorders
 
         Initiate cancel requests for one or more orders.
+        More than `CANCEL_ORDERS_MAX_BATCH` ids are split with `cancel_orders_concurrent`.
+
+        Args:
+        - order_ids: The IDs of orders cancel requests should be initiated for.
+        """
+
+        if len(order_ids) > CANCEL_ORDERS_MAX_BATCH:
+            return self.cancel_orders_concurrent(order_ids)
+
+        return self._cancel_orders_batch(order_ids)
+
+    def cancel_orders_concurrent(self,
+                                 order_ids: list,
+                                 chunk_size: int = CANCEL_ORDERS_MAX_BATCH) -> OrderBatchCancellation:
+        """
+        Initiate cancel requests for any number of orders.
+
+        Ids are split in chunks of `chunk_size` sent concurrently on the client's
+        worker pool, results are merged preserving the order of `order_ids`.
+        If a chunk request fails its error is raised, other chunks may still
+        have been cancelled.
 
         Args:
         - order_ids: The IDs of orders cancel requests should be initiated for.
+        - chunk_size: Maximum number of ids sent per request.
         """
 
+        chunks = [order_ids[i:i + chunk_size] for i in range(0, len(order_ids), chunk_size)]
+        futures = [self._executor.submit(self._cancel_orders_batch, chunk) for chunk in chunks]
+
+        results = []
+        for future in futures:
+            results.extend(future.result().results)
+
+        return OrderBatchCancellation(results=results)
+
+    def _cancel_orders_batch(self, order_ids: list) -> OrderBatchCancellation:
         request_path = "/api/v3/brokerage/orders/batch_cancel/"
         method = "POST"
 
@@ -301,11 +445,7 @@ class CoinbaseAdvancedTradeAPIClient(object):
             'order_ids': order_ids,
         }
 
-        headers = self._build_request_headers(method, request_path, json.dumps(payload))
-        response = requests.post(self._base_url+request_path,
-                                 json=payload,
-                                 headers=headers,
-                                 timeout=self.timeout)
+        response = self._request(method, request_path, body=payload)
 
         cancellation_result = OrderBatchCancellation.from_response(response)
         return cancellation_result
@@ -361,49 +501,22 @@ class CoinbaseAdvancedTradeAPIClient(object):
         request_path = '/api/v3/brokerage/orders/historical/batch'
         method = "GET"
 
-        query_params = ''
-
-        if product_id is not None:
-            query_params = self._next_param(query_params) + 'product_id='+product_id
-
-        if order_status is not None:
-            query_params = self._next_param(query_params) + 'order_status='+','.join(order_status)
-
-        if limit is not None:
-            query_params = self._next_param(query_params) + 'limit='+str(limit)
-
-        if start_date is not None:
-            query_params = self._next_param(query_params) \
-                + 'start_date=' + start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        if end_date is not None:
-            query_params = self._next_param(query_params) \
-                + 'end_date=' + end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        if user_native_currency is not None:
-            query_params = self._next_param(query_params) \
-                + 'user_native_currency=' + user_native_currency
-
-        if order_type is not None:
-            query_params = self._next_param(query_params) + 'order_type=' + order_type.value
-
-        if order_side is not None:
-            query_params = self._next_param(query_params) + 'order_side=' + order_side.value
-
-        if cursor is not None:
-            query_params = self._next_param(query_params) + 'cursor=' + cursor
-
-        if product_type is not None:
-            query_params = self._next_param(query_params) + 'product_type=' + product_type.value
-
-        if order_placement_source is not None:
-            query_params = self._next_param(query_params) + 'order_placement_source=' + order_placement_source.value
-
-        headers = self._build_request_headers(method, request_path)
-
-        response = requests.get(self._base_url+request_path+query_params,
-                                headers=headers,
-                                timeout=self.timeout)
+        params = {key: value for key, value in (
+            ('product_id', product_id),
+            ('order_status', ','.join(order_status) if order_status is not None else None),
+            ('limit', limit),
+            ('start_date', _format_datetime(start_date) if start_date is not None else None),
+            ('end_date', _format_datetime(end_date) if end_date is not None else None),
+            ('user_native_currency', user_native_currency),
+            ('order_type', ORDER_TYPE_VALUES.get(order_type, order_type)),
+            ('order_side', SIDE_VALUES.get(order_side, order_side)),
+            ('cursor', cursor),
+            ('product_type', PRODUCT_TYPE_VALUES.get(product_type, product_type)),
+            ('order_placement_source',
+             order_placement_source.value if order_placement_source is not None else None),
+        ) if value is not None}
+
+        response = self._request(method, request_path, params=params)
 
         page = OrdersPage.from_response(response)
         return page
@@ -421,10 +534,10 @@ class CoinbaseAdvancedTradeAPIClient(object):
             cursor: str = None,
             product_type: ProductType = None) -> OrdersPage:
 
-        orders_page = OrdersPage([], has_next=True, cursor=cursor, sequence=0)
+        orders_page = OrdersPage([], has_next=False, cursor=cursor, sequence=0)
 
-        while orders_page.has_next:
-            page = self.list_orders(
+        def request_page(page_cursor: str) -> OrdersPage:
+            return self.list_orders(
                 product_id=product_id,
                 order_status=order_status,
                 limit=limit,
@@ -433,8 +546,10 @@ class CoinbaseAdvancedTradeAPIClient(object):
                 user_native_currency=user_native_currency,
                 order_type=order_type,
                 order_side=order_side,
-                cursor=orders_page.cursor,
+                cursor=page_cursor,
                 product_type=product_type)
+
+        for page in self._fetch_pages_concurrent(request_page, cursor):
             orders_page.has_next = page.has_next
             orders_page.cursor = page.cursor
             orders_page.sequence = page.sequence
@@ -442,6 +557,43 @@ class CoinbaseAdvancedTradeAPIClient(object):
 
         return orders_page
 
+    def iter_orders(
+            self,
+            product_id: str = None,
+            order_status: List[str] = None,
+            limit: int = 999,
+            start_date: datetime = None,
+            end_date: datetime = None,
+            user_native_currency: str = None,
+            order_type: OrderType = None,
+            order_side: Side = None,
+            cursor: str = None,
+            product_type: ProductType = None,
+            order_placement_source: OrderPlacementSource = None) -> Iterator[Order]:
+        """
+        Iterate over all orders matching the `list_orders` filters.
+
+        Pages are requested lazily; the next page is fetched in the background
+        while the orders of the current one are being consumed.
+        """
+
+        def request_page(page_cursor: str) -> OrdersPage:
+            return self.list_orders(
+                product_id=product_id,
+                order_status=order_status,
+                limit=limit,
+                start_date=start_date,
+                end_date=end_date,
+                user_native_currency=user_native_currency,
+                order_type=order_type,
+                order_side=order_side,
+                cursor=page_cursor,
+                product_type=product_type,
+                order_placement_source=order_placement_source)
+
+        for page in self._fetch_pages_concurrent(request_page, cursor):
+            yield from page.orders
+
     def list_fills(self, order_id: str = None, product_id: str = None, start_date: datetime = None,
                    end_date: datetime = None, cursor: str = None, limit: int = 100) -> FillsPage:
         """
@@ -474,33 +626,16 @@ class CoinbaseAdvancedTradeAPIClient(object):
         request_path = '/api/v3/brokerage/orders/historical/fills'
         method = "GET"
 
-        query_params = ''
-
-        if order_id is not None:
-            query_params = self._next_param(query_params) + 'order_id='+order_id
-
-        if product_id is not None:
-            query_params = self._next_param(query_params) + 'product_id='+product_id
-
-        if limit is not None:
-            query_params = self._next_param(query_params) + 'limit='+str(limit)
-
-        if start_date is not None:
-            query_params = self._next_param(query_params) \
-                + 'start_date=' + start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        if end_date is not None:
-            query_params = self._next_param(query_params) \
-                + 'end_date=' + end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        if cursor is not None:
-            query_params = self._next_param(query_params) + 'cursor=' + cursor
-
-        headers = self._build_request_headers(method, request_path)
+        params = {key: value for key, value in (
+            ('order_id', order_id),
+            ('product_id', product_id),
+            ('limit', limit),
+            ('start_date', _format_datetime(start_date) if start_date is not None else None),
+            ('end_date', _format_datetime(end_date) if end_date is not None else None),
+            ('cursor', cursor),
+        ) if value is not None}
 
-        response = requests.get(self._base_url+request_path+query_params,
-                                headers=headers,
-                                timeout=self.timeout)
+        response = self._request(method, request_path, params=params)
 
         page = FillsPage.from_response(response)
         return page
@@ -510,14 +645,32 @@ class CoinbaseAdvancedTradeAPIClient(object):
 
         fills = FillsPage(fills=[], cursor=cursor)
 
-        while fills.cursor != '':
-            response = self.list_fills(order_id=order_id, product_id=product_id, start_date=start_date,
-                                       end_date=end_date, cursor=fills.cursor, limit=limit)
-            fills.cursor = response.cursor
-            fills.fills.extend(response.fills)
+        def request_page(page_cursor: str) -> FillsPage:
+            return self.list_fills(order_id=order_id, product_id=product_id, start_date=start_date,
+                                   end_date=end_date, cursor=page_cursor, limit=limit)
+
+        for page in self._fetch_pages_concurrent(request_page, cursor):
+            fills.cursor = page.cursor
+            fills.fills.extend(page.fills)
 
         return fills
 
+    def iter_fills(self, order_id: str = None, product_id: str = None, start_date: datetime = None,
+                   end_date: datetime = None, cursor: str = None, limit: int = 100) -> Iterator[Fill]:
+        """
+        Iterate over all fills matching the `list_fills` filters.
+
+        Pages are requested lazily; the next page is fetched in the background
+        while the fills of the current one are being consumed.
+        """
+
+        def request_page(page_cursor: str) -> FillsPage:
+            return self.list_fills(order_id=order_id, product_id=product_id, start_date=start_date,
+                                   end_date=end_date, cursor=page_cursor, limit=limit)
+
+        for page in self._fetch_pages_concurrent(request_page, cursor):
+            yield from page.fills
+
     def get_order(self, order_id: str) -> Order:
         """
         https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_gethistoricalorder
@@ -531,9 +684,7 @@ class CoinbaseAdvancedTradeAPIClient(object):
         request_path = f"/api/v3/brokerage/orders/historical/{order_id}"
         method = "GET"
 
-        headers = self._build_request_headers(method, request_path)
-
-        response = requests.get(self._base_url+request_path, headers=headers, timeout=self.timeout)
+        response = self._request(method, request_path)
 
         order = Order.from_get_order_response(response)
         return order
@@ -553,31 +704,55 @@ class CoinbaseAdvancedTradeAPIClient(object):
         - limit: A limit describing how many products to return.
         - offset: Number of products to offset before returning.
         - product_type: Type of products to return.
+
+        With a non-zero `products_cache_ttl` the response, including prices,
+        volumes and trading status, may be up to that many seconds old.
         """
 
         request_path = '/api/v3/brokerage/products'
         method = "GET"
 
-        query_params = ''
+        params = {}
 
         if limit is not None:
-            query_params = self._next_param(query_params) + 'limit='+str(limit)
+            params['limit'] = limit
 
         if offset is not None:
-            query_params = self._next_param(query_params) + 'offset='+str(offset)
+            params['offset'] = offset
 
         if product_type is not None:
-            query_params = self._next_param(query_params) + 'product_type=' + product_type.value
-
-        headers = self._build_request_headers(method, request_path)
+            params['product_type'] = PRODUCT_TYPE_VALUES.get(product_type, product_type)
 
-        response = requests.get(self._base_url+request_path+query_params,
-                                headers=headers,
-                                timeout=self.timeout)
+        response = self._cached_get(method, request_path, params, self._products_cache_ttl)
 
         page = ProductsPage.from_response(response)
         return page
 
+    def iter_products(self,
+                      limit: int = 250,
+                      offset: int = 0,
+                      product_type: ProductType = None,
+                      workers: int = 8) -> Iterator[Product]:
+        """
+        Iterate over all the available currency pairs for trading.
+
+        Up to `workers` pages are queued on the client's worker pool and yielded
+        in offset order. Iteration stops at the first page holding fewer than
+        `limit` products; queued requests past it are cancelled, though those
+        already running (at most `max_workers`) still complete.
+
+        Raises `ValueError` if `limit` or `workers` is not positive.
+        """
+
+        def request_page(page_offset: int) -> ProductsPage:
+            return self.list_products(limit=limit, offset=page_offset, product_type=product_type)
+
+        pages = self._fetch_offset_pages_concurrent(
+            request_page, offset, limit, lambda page: len(page.products), workers)
+
+        for page in pages:
+            yield from page.products
+
     def get_product(self, product_id: str) -> Product:
         """
         https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_getproduct
@@ -586,14 +761,16 @@ class CoinbaseAdvancedTradeAPIClient(object):
 
         Args:
         - product_id: The trading pair to get information for.
+
+        With a non-zero `products_cache_ttl` the product, including `price`,
+        `volume_24h`, `status` and `trading_disabled`, may be up to that many
+        seconds old.
         """
 
         request_path = f"/api/v3/brokerage/products/{product_id}"
         method = "GET"
 
-        headers = self._build_request_headers(method, request_path)
-
-        response = requests.get(self._base_url+request_path, headers=headers, timeout=self.timeout)
+        response = self._cached_get(method, request_path, {}, self._products_cache_ttl)
 
         product = Product.from_response(response)
         return product
@@ -603,7 +780,8 @@ class CoinbaseAdvancedTradeAPIClient(object):
             product_id: str,
             start_date: datetime,
             end_date: datetime,
-            granularity: Granularity) -> CandlesPage:
+            granularity: Granularity,
+            as_array: bool = False) -> CandlesPage:
         """
         https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_getcandles
 
@@ -613,25 +791,28 @@ class CoinbaseAdvancedTradeAPIClient(object):
         - product_id: The trading pair.
         - start: Timestamp for starting range of aggregations, in UNIX time.
         - end: Timestamp for ending range of aggregations, in UNIX time.
-        - granularity: The time slice value for each candle.
+        - granularity: The time slice value for each candle, as a `Granularity` or its name.
+        - as_array: Load the candles into a numpy structured array (`candles_array`)
+                    instead of `Candle` objects. Requires numpy.
         """
 
         request_path = f"/api/v3/brokerage/products/{product_id}/candles"
         method = "GET"
 
-        query_params = ''
-
-        query_params = self._next_param(query_params) + 'start=' + str(int(start_date.timestamp()))
-        query_params = self._next_param(query_params) + 'end=' + str(int(end_date.timestamp()))
-        query_params = self._next_param(query_params) + 'granularity=' + granularity.value
+        params = {
+            'start': int(start_date.timestamp()),
+            'end': int(end_date.timestamp()),
+            'granularity': GRANULARITY_VALUES.get(granularity, granularity),
+        }
 
-        headers = self._build_request_headers(method, request_path)
+        # Buckets ending more than two granularities ago are closed and never change.
+        granularity_in_secs = GRANULARITY_MAP_IN_MINUTES.get(params['granularity'], 0) * 60
+        closed = granularity_in_secs > 0 and end_date.timestamp() < time.time() - 2 * granularity_in_secs
+        ttl = CLOSED_CANDLES_CACHE_TTL if closed else 0
 
-        response = requests.get(self._base_url+request_path+query_params,
-                                headers=headers,
-                                timeout=self.timeout)
+        response = self._cached_get(method, request_path, params, ttl)
 
-        product_candles = CandlesPage.from_response(response)
+        product_candles = CandlesPage.from_response(response, as_array=as_array)
         return product_candles
 
     def get_product_candles_all(
@@ -645,7 +826,8 @@ class CoinbaseAdvancedTradeAPIClient(object):
         """
 
         # step_size: pre-calculate granularity entries in minutes.
-        step_size_in_mins = timedelta(minutes=GRANULARITY_MAP_IN_MINUTES[granularity.value])
+        granularity = GRANULARITY_VALUES.get(granularity, granularity)
+        step_size_in_mins = timedelta(minutes=GRANULARITY_MAP_IN_MINUTES[granularity])
 
         # Max amount of candles that can be returned.
         # Coinbase API enforcement/error if you try to retrieve >= 300 below:
@@ -694,15 +876,9 @@ class CoinbaseAdvancedTradeAPIClient(object):
         request_path = f"/api/v3/brokerage/products/{product_id}/ticker"
         method = "GET"
 
-        query_params = ''
+        params = {'limit': limit}
 
-        query_params = self._next_param(query_params) + 'limit=' + str(limit)
-
-        headers = self._build_request_headers(method, request_path)
-
-        response = requests.get(self._base_url+request_path+query_params,
-                                headers=headers,
-                                timeout=self.timeout)
+        response = self._request(method, request_path, params=params)
 
         trades_page = TradesPage.from_response(response)
         return trades_page
@@ -723,54 +899,147 @@ class CoinbaseAdvancedTradeAPIClient(object):
         request_path = '/api/v3/brokerage/transaction_summary'
         method = "GET"
 
-        query_params = ''
+        params = {}
 
         if start_date is not None:
-            query_params = self._next_param(query_params) \
-                + 'start_date=' + start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            params['start_date'] = _format_datetime(start_date)
 
         if end_date is not None:
-            query_params = self._next_param(query_params) \
-                + 'end_date=' + end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            params['end_date'] = _format_datetime(end_date)
 
         if user_native_currency is not None:
-            query_params = self._next_param(query_params) \
-                + 'user_native_currency='+user_native_currency
+            params['user_native_currency'] = user_native_currency
 
         if product_type is not None:
-            query_params = self._next_param(query_params) + 'product_type='+product_type.value
-
-        headers = self._build_request_headers(method, request_path)
+            params['product_type'] = PRODUCT_TYPE_VALUES.get(product_type, product_type)
 
-        response = requests.get(self._base_url+request_path+query_params,
-                                headers=headers,
-                                timeout=self.timeout)
+        response = self._request(method, request_path, params=params)
 
         page = TransactionsSummary.from_response(response)
         return page
 
     # Helpers #
 
-    def _build_request_headers(self, method, request_path, body=''):
-        timestamp = str(int(time.time()))
+    def _request(self,
+                 method: str,
+                 request_path: str,
+                 params: dict = None,
+                 body: dict = None) -> requests.Response:
+        """
+        Sign, pace and send a request to `request_path`; every endpoint goes through here.
+        """
+
+        # Serialize once and send exactly the bytes that were signed.
+        data = orjson.dumps(body) if body is not None else None
 
-        message = timestamp+method+request_path+body
-        signature = self._create_signature(message)
+        # Sign after waiting for a token so the timestamp is fresh when sent.
+        self._limiter.acquire()
 
-        return {
-            "accept": "application/json",
-            'CB-ACCESS-KEY': self._api_key,
-            'CB-ACCESS-TIMESTAMP': timestamp,
-            'CB-ACCESS-SIGN': signature,
-        }
+        headers = self._build_request_headers(method, request_path, data or b'')
+
+        if data is not None:
+            headers.update(self._JSON_HEADERS)
+
+        return self._session.request(method, self._base_url+request_path,
+                                     params=params,
+                                     data=data,
+                                     headers=headers,
+                                     timeout=self.timeout)
+
+    def _cached_get(self, method: str, request_path: str, params: dict, ttl: float) -> requests.Response:
+        key = (request_path, tuple(sorted(params.items())))
+        now = time.monotonic()
+
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > now:
+                self._cache.move_to_end(key)
+                return entry[1]
+
+        response = self._request(method, request_path, params=params)
+
+        if response.ok and ttl > 0 and self._cache_size > 0:
+            with self._cache_lock:
+                self._cache[key] = (now + ttl, response)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+
+        return response
+
+    def _fetch_pages_concurrent(self,
+                                request_fn: Callable[[str], object],
+                                cursor: str = None,
+                                cursor_field: str = 'cursor') -> Iterator[object]:
+        """
+        Yield the pages of a cursor paginated endpoint.
+
+        Each cursor only arrives with the previous page, so pages are inherently
+        sequential; the next page is requested on the client's worker pool as
+        soon as its cursor is known, overlapping its round trip with the
+        caller's processing of the current one. If the caller stops early the
+        prefetch is cancelled when still queued.
+        """
+
+        page = request_fn(cursor)
+        future = None
+
+        try:
+            while page is not None:
+                next_cursor = getattr(page, cursor_field)
+                has_next = getattr(page, 'has_next', True) and next_cursor
+
+                future = self._executor.submit(request_fn, next_cursor) if has_next else None
+                yield page
+                page = future.result() if future is not None else None
+        finally:
+            if future is not None:
+                future.cancel()
+
+    def _fetch_offset_pages_concurrent(self,
+                                       request_fn: Callable[[int], object],
+                                       offset: int,
+                                       limit: int,
+                                       size_fn: Callable[[object], int],
+                                       workers: int = 8) -> Iterator[object]:
+        """
+        Yield the pages of an offset paginated endpoint in offset order,
+        keeping up to `workers` page requests queued on the client's worker pool.
+
+        Results are read in offset order, so a failure on a speculative page
+        past the end is never raised; requests still queued once the last
+        page arrives are cancelled before it is yielded.
+        """
+
+        # Without a positive page size the end of the listing is never reached.
+        if limit is None or limit < 1:
+            raise ValueError(f"limit must be a positive integer, got {limit!r}")
+
+        if workers < 1:
+            raise ValueError(f"workers must be a positive integer, got {workers!r}")
+
+        pending = deque()
+
+        try:
+            while True:
+                while len(pending) < workers:
+                    pending.append(self._executor.submit(request_fn, offset))
+                    offset += limit
+
+                page = pending.popleft().result()
+
+                if size_fn(page) < limit:
+                    break
+
+                yield page
+        finally:
+            for future in pending:
+                future.cancel()
 
-    def _create_signature(self, message):
-        signature = hmac.new(
-            self._secret_key.encode('utf-8'),
-            message.encode('utf-8'),
-            digestmod=hashlib.sha256).digest().hex()
+        yield page
 
-        return signature
+    def _build_request_headers(self, method: str, request_path: str, body: bytes = b'') -> dict:
+        return _signing.build_request_headers(self._api_key, self._secret_bytes, method, request_path, body)
 
-    def _next_param(self, query_params: str) -> str:
-        return query_params + ('?' if query_params == '' else '&')
+    def _create_signature(self, message: bytes) -> str:
+        return _signing.create_signature(self._secret_bytes, message)
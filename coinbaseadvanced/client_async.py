@@ -0,0 +1,545 @@
+"""
+Asynchronous API Client for Coinbase Advanced Trade endpoints.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import List
+
+import httpx
+import orjson
+
+from coinbaseadvanced import _signing
+from coinbaseadvanced.client import _format_datetime
+from coinbaseadvanced.models.fees import TransactionsSummary
+from coinbaseadvanced.models.products import ProductsPage, Product, CandlesPage,\
+    TradesPage, ProductType, Granularity, GRANULARITY_VALUES, PRODUCT_TYPE_VALUES
+from coinbaseadvanced.models.accounts import AccountsPage, Account
+from coinbaseadvanced.models.orders import OrderPlacementSource, OrdersPage, Order,\
+    OrderBatchCancellation, FillsPage, Side, StopDirection, OrderType, SIDE_VALUES, ORDER_TYPE_VALUES
+
+
+# GET responses retried with backoff, matching the synchronous client's adapter.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.2
+
+
+class _AsyncRateLimiter(object):
+    """
+    Token bucket pacing coroutines before requests are sent, the asyncio
+    counterpart of `client._RateLimiter`.
+    """
+
+    def __init__(self, rate: float = 5, burst: int = 10) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        # Created on first use so it binds to the loop the client runs on.
+        self._lock = None
+
+    async def acquire(self) -> None:
+        """
+        Take one token, sleeping until one is available if the bucket is empty.
+        """
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            wait = (1 - self._tokens) / self._rate
+            await asyncio.sleep(wait)
+            self._tokens = 0.0
+            self._last = now + wait
+
+
+class _Response(object):
+    """
+    Exposes an `httpx.Response` through the `requests.Response` attributes
+    read by the model factories.
+    """
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._response = response
+
+    @property
+    def ok(self) -> bool:
+        return self._response.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self._response.text
+
+    @property
+    def content(self) -> bytes:
+        return self._response.content
+
+
+class AsyncCoinbaseAdvancedTradeAPIClient(object):
+    """
+    Asynchronous API Client for Coinbase Advanced Trade endpoints.
+
+    Requests share a single HTTP/2 connection, so independent calls can be
+    issued concurrently, e.g.:
+
+        products = await asyncio.gather(*[client.get_product(p) for p in product_ids])
+
+    Concurrent calls are paced by the same 5 requests/second (10 burst) budget
+    as the synchronous client.
+    """
+
+    # Extra headers sent with every JSON request body.
+    _JSON_HEADERS = {'Content-Type': 'application/json'}
+
+    def __init__(self,
+                 api_key: str,
+                 secret_key: str,
+                 base_url: str = 'https://api.coinbase.com',
+                 timeout: int = 10) -> None:
+        self._api_key = api_key
+        self._secret_bytes = secret_key.encode('utf-8')
+        self.timeout = timeout
+
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            http2=True,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20))
+
+        # Coinbase private endpoints allow 5 requests/second sustained, 10 in bursts.
+        self._limiter = _AsyncRateLimiter(rate=5, burst=10)
+
+    async def close(self) -> None:
+        """
+        Release the connections held by the client.
+        """
+
+        await self._client.aclose()
+
+    async def __aenter__(self) -> 'AsyncCoinbaseAdvancedTradeAPIClient':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    # Accounts #
+
+    async def list_accounts(self, limit: int = 49, cursor: str = None) -> AccountsPage:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_getaccounts
+
+        Get a list of authenticated accounts for the current user.
+        See `CoinbaseAdvancedTradeAPIClient.list_accounts`.
+        """
+
+        request_path = '/api/v3/brokerage/accounts'
+
+        params = {'limit': limit}
+
+        if cursor is not None:
+            params['cursor'] = cursor
+
+        response = await self._get(request_path, params)
+        return AccountsPage.from_response(response)
+
+    async def get_account(self, account_id: str) -> Account:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_getaccount
+
+        Get a list of information about an account, given an account UUID.
+        """
+
+        request_path = f"/api/v3/brokerage/accounts/{account_id}"
+
+        response = await self._get(request_path)
+        return Account.from_response(response)
+
+    # Orders #
+
+    async def create_buy_market_order(self,
+                                      client_order_id: str,
+                                      product_id: str,
+                                      quote_size: float) -> Order:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_postorder
+
+        Create a buy type market order.
+        See `CoinbaseAdvancedTradeAPIClient.create_buy_market_order`.
+        """
+
+        order_configuration = {
+            "market_market_ioc": {
+                "quote_size": str(quote_size),
+            }
+        }
+
+        return await self.create_order(client_order_id, product_id, Side.BUY, order_configuration)
+
+    async def create_sell_market_order(self,
+                                       client_order_id: str,
+                                       product_id: str,
+                                       base_size: float) -> Order:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_postorder
+
+        Create a sell type market order.
+        See `CoinbaseAdvancedTradeAPIClient.create_sell_market_order`.
+        """
+
+        order_configuration = {
+            "market_market_ioc": {
+                "base_size": str(base_size),
+            }
+        }
+
+        return await self.create_order(client_order_id, product_id, Side.SELL, order_configuration)
+
+    async def create_limit_order(
+            self,
+            client_order_id: str,
+            product_id: str,
+            side: Side,
+            limit_price: float,
+            base_size: float,
+            cancel_time: datetime = None,
+            post_only: bool = None) -> Order:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_postorder
+
+        Create a limit order.
+        See `CoinbaseAdvancedTradeAPIClient.create_limit_order`.
+        """
+
+        order_configuration = {}
+
+        limit_order_configuration = {
+            "limit_price": str(limit_price),
+            "base_size": str(base_size),
+        }
+
+        if post_only is not None:
+            limit_order_configuration['post_only'] = post_only
+
+        if cancel_time is not None:
+            limit_order_configuration['end_time'] = _format_datetime(cancel_time)
+            order_configuration['limit_limit_gtd'] = limit_order_configuration
+        else:
+            order_configuration['limit_limit_gtc'] = limit_order_configuration
+
+        return await self.create_order(client_order_id, product_id, side, order_configuration)
+
+    async def create_stop_limit_order(
+            self,
+            client_order_id: str,
+            product_id: str,
+            side: Side,
+            stop_price: float,
+            stop_direction: StopDirection,
+            limit_price: float,
+            base_size: float,
+            cancel_time: datetime = None) -> Order:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_postorder
+
+        Create a stop-limit order.
+        See `CoinbaseAdvancedTradeAPIClient.create_stop_limit_order`.
+        """
+
+        order_configuration = {}
+
+        stop_limit_order_configuration = {
+            "stop_price": str(stop_price),
+            "limit_price": str(limit_price),
+            "base_size": str(base_size),
+            "stop_direction": stop_direction.value,
+        }
+
+        if cancel_time is not None:
+            stop_limit_order_configuration['end_time'] = _format_datetime(cancel_time)
+            order_configuration['stop_limit_stop_limit_gtd'] = stop_limit_order_configuration
+        else:
+            order_configuration['stop_limit_stop_limit_gtc'] = stop_limit_order_configuration
+
+        return await self.create_order(client_order_id, product_id, side, order_configuration)
+
+    async def create_order(self, client_order_id: str,
+                           product_id: str,
+                           side: Side,
+                           order_configuration: dict) -> Order:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_postorder
+
+        Create an order with a specified product_id (asset-pair), side (buy/sell), etc.
+        See `CoinbaseAdvancedTradeAPIClient.create_order`.
+        """
+
+        request_path = "/api/v3/brokerage/orders"
+
+        payload = {
+            'client_order_id': client_order_id,
+            'product_id': product_id,
+            'side': SIDE_VALUES.get(side, side),
+            'order_configuration': order_configuration
+        }
+
+        response = await self._post(request_path, payload)
+        return Order.from_create_order_response(response)
+
+    async def cancel_orders(self, order_ids: list) -> OrderBatchCancellation:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_cancelorders
+
+        Initiate cancel requests for one or more orders.
+        """
+
+        request_path = "/api/v3/brokerage/orders/batch_cancel/"
+
+        payload = {
+            'order_ids': order_ids,
+        }
+
+        response = await self._post(request_path, payload)
+        return OrderBatchCancellation.from_response(response)
+
+    async def list_orders(
+            self,
+            product_id: str = None,
+            order_status: List[str] = None,
+            limit: int = 999,
+            start_date: datetime = None,
+            end_date: datetime = None,
+            user_native_currency: str = None,
+            order_type: OrderType = None,
+            order_side: Side = None,
+            cursor: str = None,
+            product_type: ProductType = None,
+            order_placement_source: OrderPlacementSource = None,
+    ) -> OrdersPage:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_gethistoricalorders
+
+        Get a list of orders filtered by optional query parameters (product_id, order_status, etc).
+        See `CoinbaseAdvancedTradeAPIClient.list_orders`.
+        """
+
+        request_path = '/api/v3/brokerage/orders/historical/batch'
+
+        params = {key: value for key, value in (
+            ('product_id', product_id),
+            ('order_status', ','.join(order_status) if order_status is not None else None),
+            ('limit', limit),
+            ('start_date', _format_datetime(start_date) if start_date is not None else None),
+            ('end_date', _format_datetime(end_date) if end_date is not None else None),
+            ('user_native_currency', user_native_currency),
+            ('order_type', ORDER_TYPE_VALUES.get(order_type, order_type)),
+            ('order_side', SIDE_VALUES.get(order_side, order_side)),
+            ('cursor', cursor),
+            ('product_type', PRODUCT_TYPE_VALUES.get(product_type, product_type)),
+            ('order_placement_source',
+             order_placement_source.value if order_placement_source is not None else None),
+        ) if value is not None}
+
+        response = await self._get(request_path, params)
+        return OrdersPage.from_response(response)
+
+    async def list_fills(self, order_id: str = None, product_id: str = None, start_date: datetime = None,
+                         end_date: datetime = None, cursor: str = None, limit: int = 100) -> FillsPage:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_getfills
+
+        Get a list of fills filtered by optional query parameters (product_id, order_id, etc).
+        See `CoinbaseAdvancedTradeAPIClient.list_fills`.
+        """
+
+        request_path = '/api/v3/brokerage/orders/historical/fills'
+
+        params = {key: value for key, value in (
+            ('order_id', order_id),
+            ('product_id', product_id),
+            ('limit', limit),
+            ('start_date', _format_datetime(start_date) if start_date is not None else None),
+            ('end_date', _format_datetime(end_date) if end_date is not None else None),
+            ('cursor', cursor),
+        ) if value is not None}
+
+        response = await self._get(request_path, params)
+        return FillsPage.from_response(response)
+
+    async def get_order(self, order_id: str) -> Order:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_gethistoricalorder
+
+        Get a single order by order ID.
+        """
+
+        request_path = f"/api/v3/brokerage/orders/historical/{order_id}"
+
+        response = await self._get(request_path)
+        return Order.from_get_order_response(response)
+
+    # Products #
+
+    async def list_products(self,
+                            limit: int = None,
+                            offset: int = None,
+                            product_type: ProductType = None) -> ProductsPage:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_getproducts
+
+        Get a list of the available currency pairs for trading.
+        """
+
+        request_path = '/api/v3/brokerage/products'
+
+        params = {}
+
+        if limit is not None:
+            params['limit'] = limit
+
+        if offset is not None:
+            params['offset'] = offset
+
+        if product_type is not None:
+            params['product_type'] = PRODUCT_TYPE_VALUES.get(product_type, product_type)
+
+        response = await self._get(request_path, params)
+        return ProductsPage.from_response(response)
+
+    async def get_product(self, product_id: str) -> Product:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_getproduct
+
+        Get information on a single product by product ID.
+        """
+
+        request_path = f"/api/v3/brokerage/products/{product_id}"
+
+        response = await self._get(request_path)
+        return Product.from_response(response)
+
+    async def get_product_candles(
+            self,
+            product_id: str,
+            start_date: datetime,
+            end_date: datetime,
+            granularity: Granularity,
+            as_array: bool = False) -> CandlesPage:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_getcandles
+
+        Get rates for a single product by product ID, grouped in buckets.
+        See `CoinbaseAdvancedTradeAPIClient.get_product_candles`.
+        """
+
+        request_path = f"/api/v3/brokerage/products/{product_id}/candles"
+
+        params = {
+            'start': int(start_date.timestamp()),
+            'end': int(end_date.timestamp()),
+            'granularity': GRANULARITY_VALUES.get(granularity, granularity),
+        }
+
+        response = await self._get(request_path, params)
+        return CandlesPage.from_response(response, as_array=as_array)
+
+    async def get_market_trades(self, product_id: str, limit: int) -> TradesPage:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_getmarkettrades
+
+        Get snapshot information, by product ID, about the last trades (ticks),
+        best bid/ask, and 24h volume.
+        """
+
+        request_path = f"/api/v3/brokerage/products/{product_id}/ticker"
+
+        params = {'limit': limit}
+
+        response = await self._get(request_path, params)
+        return TradesPage.from_response(response)
+
+    # Fees #
+
+    async def get_transactions_summary(self,
+                                       start_date: datetime = None,
+                                       end_date: datetime = None,
+                                       user_native_currency: str = "USD",
+                                       product_type: ProductType = None) -> TransactionsSummary:
+        """
+        https://docs.cloud.coinbase.com/advanced-trade-api/reference/retailbrokerageapi_gettransactionsummary
+
+        Get a summary of transactions with fee tiers, total volume, and fees.
+        """
+
+        request_path = '/api/v3/brokerage/transaction_summary'
+
+        params = {}
+
+        if start_date is not None:
+            params['start_date'] = _format_datetime(start_date)
+
+        if end_date is not None:
+            params['end_date'] = _format_datetime(end_date)
+
+        if user_native_currency is not None:
+            params['user_native_currency'] = user_native_currency
+
+        if product_type is not None:
+            params['product_type'] = PRODUCT_TYPE_VALUES.get(product_type, product_type)
+
+        response = await self._get(request_path, params)
+        return TransactionsSummary.from_response(response)
+
+    # Helpers #
+
+    async def _get(self, request_path: str, params: dict = None) -> _Response:
+        """
+        Pace, sign and send a GET, retrying throttled and server errors.
+        Once retries run out the last response is returned for the caller's error handling.
+        """
+
+        for attempt in range(MAX_RETRIES + 1):
+            # Sign after waiting for a token so the timestamp is fresh when sent.
+            await self._limiter.acquire()
+            headers = self._build_request_headers("GET", request_path)
+
+            response = await self._client.get(request_path, params=params, headers=headers)
+
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return _Response(response)
+
+            await asyncio.sleep(_retry_delay(response, attempt))
+
+    async def _post(self, request_path: str, payload: dict) -> _Response:
+        # Send exactly the bytes that were signed; orders are never retried.
+        body = orjson.dumps(payload)
+
+        await self._limiter.acquire()
+        headers = self._build_request_headers("POST", request_path, body)
+        headers.update(self._JSON_HEADERS)
+
+        response = await self._client.post(request_path, content=body, headers=headers)
+        return _Response(response)
+
+    def _build_request_headers(self, method: str, request_path: str, body: bytes = b'') -> dict:
+        return _signing.build_request_headers(self._api_key, self._secret_bytes, method, request_path, body)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """
+    Seconds to wait before retrying `response`, honouring a numeric Retry-After header.
+    """
+
+    try:
+        return float(response.headers['Retry-After'])
+    except (KeyError, ValueError):
+        return RETRY_BACKOFF_FACTOR * (2 ** attempt)
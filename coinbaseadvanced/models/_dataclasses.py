@@ -0,0 +1,20 @@
+"""
+Helpers for the dataclass based response models.
+"""
+
+from dataclasses import fields
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> frozenset:
+    return frozenset(field.name for field in fields(cls))
+
+
+def from_dict(cls, data: dict):
+    """
+    Build dataclass `cls` from an API object, dropping fields it does not declare.
+    """
+
+    names = _field_names(cls)
+    return cls(**{key: value for key, value in data.items() if key in names})
@@ -2,11 +2,11 @@
 Object models for account related endpoints args and response.
 """
 
-import json
 from datetime import datetime
 from typing import List
 from uuid import UUID
 
+import orjson
 import requests
 
 from coinbaseadvanced.models.error import CoinbaseAdvancedTradeAPIError
@@ -74,7 +74,7 @@ class Account:
         if not response.ok:
             raise CoinbaseAdvancedTradeAPIError.not_ok_response(response)
 
-        result = json.loads(response.text)
+        result = orjson.loads(response.content)
         account_dict = result['account']
         return cls(**account_dict)
 
@@ -97,8 +97,7 @@ class AccountsPage:
                  **kwargs
                  ) -> None:
 
-        self.accounts = list(map(lambda x: Account(**x), accounts))\
-            if accounts is not None else None
+        self.accounts = [Account(**x) for x in accounts] if accounts is not None else None
 
         self.has_next = has_next
         self.cursor = cursor
@@ -115,7 +114,7 @@ class AccountsPage:
         if not response.ok:
             raise CoinbaseAdvancedTradeAPIError.not_ok_response(response)
 
-        result = json.loads(response.text)
+        result = orjson.loads(response.content)
         return cls(**result)
 
     def __iter__(self):
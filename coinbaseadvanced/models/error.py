@@ -2,8 +2,7 @@
 Encapsulating error types.
 """
 
-import json
-
+import orjson
 import requests
 
 
@@ -26,7 +25,7 @@ class CoinbaseAdvancedTradeAPIError(Exception):
         """
 
         try:
-            error_result = json.loads(response.text)
+            error_result = orjson.loads(response.content)
         except ValueError as error:
             error_result = {'reason': response.text}
 
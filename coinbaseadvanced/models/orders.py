@@ -2,11 +2,11 @@
 Object models for order related endpoints args and response.
 """
 
-import json
 from datetime import datetime
 from enum import Enum
 from typing import List
 
+import orjson
 import requests
 
 from coinbaseadvanced.models.error import CoinbaseAdvancedTradeAPIError
@@ -21,6 +21,11 @@ class Side(Enum):
     SELL = "SELL"
 
 
+# Wire value keyed by member, name and value, so callers can pass either an enum or a string.
+SIDE_VALUES = {key: member.value for member in Side
+               for key in (member, member.name, member.value)}
+
+
 class StopDirection(Enum):
     """
     Enum direction in an stop order context.
@@ -43,6 +48,10 @@ class OrderType(Enum):
     STOP_LIMIT = "STOP_LIMIT"
 
 
+ORDER_TYPE_VALUES = {key: member.value for member in OrderType
+                     for key in (member, member.name, member.value)}
+
+
 class OrderPlacementSource(Enum):
     """
     Enum representing placements source for an order.
@@ -320,7 +329,7 @@ class Order:
         if not response.ok:
             raise CoinbaseAdvancedTradeAPIError.not_ok_response(response)
 
-        result = json.loads(response.text)
+        result = orjson.loads(response.content)
 
         if not result['success']:
             error_response = result['error_response']
@@ -343,7 +352,7 @@ class Order:
         if not response.ok:
             raise CoinbaseAdvancedTradeAPIError.not_ok_response(response)
 
-        result = json.loads(response.text)
+        result = orjson.loads(response.content)
 
         order = result['order']
 
@@ -367,7 +376,7 @@ class OrdersPage:
                  sequence: int, **kwargs
                  ) -> None:
 
-        self.orders = list(map(lambda x: Order(**x), orders)) if orders is not None else None
+        self.orders = [Order(**x) for x in orders] if orders is not None else None
 
         self.has_next = has_next
         self.cursor = cursor
@@ -384,7 +393,7 @@ class OrdersPage:
         if not response.ok:
             raise CoinbaseAdvancedTradeAPIError.not_ok_response(response)
 
-        result = json.loads(response.text)
+        result = orjson.loads(response.content)
         return cls(**result)
 
     def __iter__(self):
@@ -429,7 +438,7 @@ class OrderBatchCancellation:
         if not response.ok:
             raise CoinbaseAdvancedTradeAPIError.not_ok_response(response)
 
-        result = json.loads(response.text)
+        result = orjson.loads(response.content)
 
         return cls(**result)
 
@@ -505,7 +514,7 @@ class FillsPage:
                  cursor: str, **kwargs
                  ) -> None:
 
-        self.fills = list(map(lambda x: Fill(**x), fills)) if fills is not None else None
+        self.fills = [Fill(**x) for x in fills] if fills is not None else None
 
         self.cursor = cursor
 
@@ -520,7 +529,7 @@ class FillsPage:
         if not response.ok:
             raise CoinbaseAdvancedTradeAPIError.not_ok_response(response)
 
-        result = json.loads(response.text)
+        result = orjson.loads(response.content)
         return cls(**result)
 
     def __iter__(self):
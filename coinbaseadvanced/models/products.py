@@ -2,14 +2,17 @@
 Object models for products related endpoints args and response.
 """
 
-import json
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from operator import itemgetter
 from typing import List
 from uuid import UUID
 
+import orjson
 import requests
 
+from coinbaseadvanced.models._dataclasses import from_dict
 from coinbaseadvanced.models.error import CoinbaseAdvancedTradeAPIError
 
 
@@ -21,6 +24,11 @@ class ProductType(Enum):
     SPOT = "SPOT"
 
 
+# Wire value keyed by member, name and value, so callers can pass either an enum or a string.
+PRODUCT_TYPE_VALUES = {key: member.value for member in ProductType
+                       for key in (member, member.name, member.value)}
+
+
 GRANULARITY_MAP_IN_MINUTES = {
     "ONE_MINUTE": 1,
     "FIVE_MINUTE": 5,
@@ -49,11 +57,25 @@ class Granularity(Enum):
     ONE_DAY = "ONE_DAY"
 
 
+GRANULARITY_VALUES = {key: member.value for member in Granularity
+                      for key in (member, member.name, member.value)}
+
+
+@dataclass(eq=False)
 class Product:
     """
     Object representing a product.
     """
 
+    __slots__ = ('product_id', 'price', 'price_percentage_change_24h', 'volume_24h',
+                 'volume_percentage_change_24h', 'base_increment', 'quote_increment',
+                 'quote_min_size', 'quote_max_size', 'base_min_size', 'base_max_size', 'base_name',
+                 'quote_name', 'watched', 'is_disabled', 'new', 'status', 'cancel_only',
+                 'limit_only', 'post_only', 'trading_disabled', 'auction_mode', 'product_type',
+                 'quote_currency_id', 'base_currency_id', 'mid_market_price',
+                 'fcm_trading_session_details', 'alias', 'alias_to', 'base_display_symbol',
+                 'quote_display_symbol')
+
     product_id: str
     price: str
     price_percentage_change_24h: str
@@ -86,73 +108,6 @@ class Product:
     base_display_symbol: str
     quote_display_symbol: str
 
-    def __init__(self,
-                 product_id: str,
-                 price: str,
-                 price_percentage_change_24h: str,
-                 volume_24h: int,
-                 volume_percentage_change_24h: str,
-                 base_increment: str,
-                 quote_increment: str,
-                 quote_min_size: str,
-                 quote_max_size: int,
-                 base_min_size: str,
-                 base_max_size: int,
-                 base_name: str,
-                 quote_name: str,
-                 watched: bool,
-                 is_disabled: bool,
-                 new: bool,
-                 status: str,
-                 cancel_only: bool,
-                 limit_only: bool,
-                 post_only: bool,
-                 trading_disabled: bool,
-                 auction_mode: bool,
-                 product_type: str,
-                 quote_currency_id: str,
-                 base_currency_id: str,
-                 mid_market_price: str,
-                 fcm_trading_session_details: str,
-                 alias: str,
-                 alias_to: list,
-                 base_display_symbol: str,
-                 quote_display_symbol: str, **kwargs
-                 ) -> None:
-        self.product_id = product_id
-        self.price = price
-        self.price_percentage_change_24h = price_percentage_change_24h
-        self.volume_24h = volume_24h
-        self.volume_percentage_change_24h = volume_percentage_change_24h
-        self.base_increment = base_increment
-        self.quote_increment = quote_increment
-        self.quote_min_size = quote_min_size
-        self.quote_max_size = quote_max_size
-        self.base_min_size = base_min_size
-        self.base_max_size = base_max_size
-        self.base_name = base_name
-        self.quote_name = quote_name
-        self.watched = watched
-        self.is_disabled = is_disabled
-        self.new = new
-        self.status = status
-        self.cancel_only = cancel_only
-        self.limit_only = limit_only
-        self.post_only = post_only
-        self.trading_disabled = trading_disabled
-        self.auction_mode = auction_mode
-        self.product_type = product_type
-        self.quote_currency_id = quote_currency_id
-        self.base_currency_id = base_currency_id
-        self.mid_market_price = mid_market_price
-        self.fcm_trading_session_details = fcm_trading_session_details
-        self.alias = alias
-        self.alias_to = alias_to
-        self.base_display_symbol = base_display_symbol
-        self.quote_display_symbol = quote_display_symbol
-
-        self.kwargs = kwargs
-
     @classmethod
     def from_response(cls, response: requests.Response) -> 'Product':
         """
@@ -162,9 +117,8 @@ class Product:
         if not response.ok:
             raise CoinbaseAdvancedTradeAPIError.not_ok_response(response)
 
-        result = json.loads(response.text)
-        product_dict = result
-        return cls(**product_dict)
+        result = orjson.loads(response.content)
+        return from_dict(cls, result)
 
 
 class ProductsPage:
@@ -176,8 +130,7 @@ class ProductsPage:
     num_products: int
 
     def __init__(self, products: List[Product], num_products: int, **kwargs) -> None:
-        self.products = list(map(lambda x: Product(**x), products)) \
-            if products is not None else None
+        self.products = [from_dict(Product, x) for x in products] if products is not None else None
 
         self.num_products = num_products
 
@@ -192,18 +145,52 @@ class ProductsPage:
         if not response.ok:
             raise CoinbaseAdvancedTradeAPIError.not_ok_response(response)
 
-        result = json.loads(response.text)
+        result = orjson.loads(response.content)
         return cls(**result)
 
     def __iter__(self):
         return self.products.__iter__()
 
 
+# Column layout of the structured array returned by `CandlesPage.as_numpy`.
+CANDLE_DTYPE = [
+    ('start', 'i8'),
+    ('low', 'f8'),
+    ('high', 'f8'),
+    ('open', 'f8'),
+    ('close', 'f8'),
+    ('volume', 'f8'),
+]
+
+
+# Candles have a fixed schema, fields are passed positionally to `Candle`.
+_CANDLE_FIELDS = itemgetter('start', 'low', 'high', 'open', 'close', 'volume')
+
+
+def _candles_to_array(rows: list, get_field) -> 'numpy.ndarray':
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError(
+            "numpy is required for array candles, install it with `pip install coinbaseadvanced[numpy]`.") \
+            from error
+
+    array = numpy.empty(len(rows), dtype=CANDLE_DTYPE)
+    for name, kind in CANDLE_DTYPE:
+        cast = int if kind == 'i8' else float
+        array[name] = numpy.fromiter((cast(get_field(row, name)) for row in rows), kind, count=len(rows))
+
+    return array
+
+
+@dataclass(eq=False)
 class Candle:
     """
     Candle object.
     """
 
+    __slots__ = ('start', 'low', 'high', 'open', 'close', 'volume')
+
     start: int
     low: str
     high: str
@@ -211,16 +198,6 @@ class Candle:
     close: str
     volume: int
 
-    def __init__(self, start: int, low: str, high: str, open: str, close: str, volume: int, **kwargs) -> None:
-        self.start = start
-        self.low = low
-        self.high = high
-        self.open = open
-        self.close = close
-        self.volume = volume
-
-        self.kwargs = kwargs
-
 
 class CandlesPage:
     """
@@ -228,33 +205,60 @@ class CandlesPage:
     """
 
     candles: List[Candle]
+    candles_array: 'numpy.ndarray'
 
     def __init__(self, candles: List[Candle], **kwargs) -> None:
-        self.candles = list(map(lambda x: Candle(**x), candles)) if candles is not None else None
+        self.candles = [Candle(*_CANDLE_FIELDS(x)) for x in candles] if candles is not None else None
+        self.candles_array = None
 
         self.kwargs = kwargs
 
     @classmethod
-    def from_response(cls, response: requests.Response) -> 'CandlesPage':
+    def from_response(cls, response: requests.Response, as_array: bool = False) -> 'CandlesPage':
         """
         Factory Method.
+
+        With `as_array` the candles are loaded straight into `candles_array`
+        (see `as_numpy`) and no `Candle` objects are built.
         """
 
         if not response.ok:
             raise CoinbaseAdvancedTradeAPIError.not_ok_response(response)
 
-        result = json.loads(response.text)
-        return cls(**result)
+        result = orjson.loads(response.content)
+
+        if not as_array:
+            return cls(**result)
+
+        raw_candles = result.pop('candles', None) or []
+        page = cls(candles=None, **result)
+        page.candles_array = _candles_to_array(raw_candles, dict.__getitem__)
+        return page
+
+    def as_numpy(self) -> 'numpy.ndarray':
+        """
+        Candles as a numpy structured array with `CANDLE_DTYPE` columns,
+        numeric fields converted from the strings returned by the API.
+        Requires numpy.
+        """
+
+        if self.candles_array is None:
+            self.candles_array = _candles_to_array(self.candles or [], getattr)
+
+        return self.candles_array
 
     def __iter__(self):
         return self.candles.__iter__()
 
 
+@dataclass(eq=False)
 class Trade:
     """
     Trade object data.
     """
 
+    __slots__ = ('trade_id', 'product_id', 'price', 'size', 'time', 'side', 'bid', 'ask')
+
     trade_id: UUID
     product_id: str
     price: str
@@ -264,26 +268,6 @@ class Trade:
     bid: str
     ask: str
 
-    def __init__(self,
-                 trade_id: UUID,
-                 product_id: str,
-                 price: str,
-                 size: int,
-                 time: datetime,
-                 side: str,
-                 bid: str,
-                 ask: str, **kwargs) -> None:
-        self.trade_id = trade_id
-        self.product_id = product_id
-        self.price = price
-        self.size = size
-        self.time = time
-        self.side = side
-        self.bid = bid
-        self.ask = ask
-
-        self.kwargs = kwargs
-
 
 class TradesPage:
     """
@@ -299,7 +283,7 @@ class TradesPage:
                  best_bid: str,
                  best_ask: str, **kwargs
                  ) -> None:
-        self.trades = list(map(lambda x: Trade(**x), trades)) if trades is not None else None
+        self.trades = [from_dict(Trade, x) for x in trades] if trades is not None else None
         self.best_bid = best_bid
         self.best_ask = best_ask
 
@@ -314,7 +298,7 @@ class TradesPage:
         if not response.ok:
             raise CoinbaseAdvancedTradeAPIError.not_ok_response(response)
 
-        result = json.loads(response.text)
+        result = orjson.loads(response.content)
         return cls(**result)
 
     def __iter__(self):
@@ -2,17 +2,30 @@
 Package Setup Configurations.
 """
 
+import os
+
 from setuptools import setup
 
 import coinbaseadvanced
 
 requirements = [
+    'orjson>=3.8.3',
     'requests>=2.28.1',
     'requests-toolbelt>=0.10.1',
     'typed-ast>=1.5.4',
     'typing-extensions>=4.4.0',
 ]
 
+# Request signing runs on every call; optionally compile it with mypyc.
+ext_modules = []
+if os.environ.get('COINBASEADVANCED_MYPYC'):
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        pass
+    else:
+        ext_modules = mypycify(['coinbaseadvanced/_signing.py'])
+
 with open("README.md", "r", encoding="utf-8") as fh:
     readme = fh.read()
 
@@ -31,6 +44,12 @@ setup(
     author_email='kmiloc89@gmail.com',
     keywords=['api', 'coinbase', 'bitcoin', 'client'],
     install_requires=requirements,
+    ext_modules=ext_modules,
+    extras_require={
+        'numpy': ['numpy>=1.21'],
+        'async': ['httpx[http2]>=0.23'],
+        'analytics': ['numba>=0.56', 'numpy>=1.21'],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -14,6 +14,7 @@ def fixtured_mock_response(
     # set status code and content
     mock_resp.ok = ok
     mock_resp.text = text
+    mock_resp.content = text.encode('utf-8')
 
     return mock_resp
 
@@ -178,6 +179,14 @@ def fixture_list_products_success_response() -> str:
             text=content)
 
 
+def fixture_list_products_empty_success_response() -> str:
+    with open('tests/fixtures/list_products_empty_success_response.json', 'r', encoding="utf-8") as file:
+        content = file.read()
+        return fixtured_mock_response(
+            ok=True,
+            text=content)
+
+
 def fixture_get_product_success_response() -> str:
     with open('tests/fixtures/get_product_success_response.json', 'r', encoding="utf-8") as file:
         content = file.read()
@@ -0,0 +1,70 @@
+"""
+Candle analytics unit tests.
+"""
+
+import unittest
+
+try:
+    import numpy
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    from coinbaseadvanced.analytics import sma, ema, rsi
+    from coinbaseadvanced.models.products import CANDLE_DTYPE
+
+
+@unittest.skipIf(numba is None, "numba is not installed")
+class TestAnalytics(unittest.TestCase):
+    """
+    Unit tests for the compiled candle indicators.
+    """
+
+    def test_sma(self):
+        close = numpy.array([1.0, 2.0, 3.0, 4.0, 5.0])
+
+        result = sma(close, 3)
+
+        self.assertTrue(numpy.isnan(result[:2]).all())
+        numpy.testing.assert_allclose(result[2:], [2.0, 3.0, 4.0])
+
+    def test_sma_on_structured_candles_column(self):
+        candles = numpy.zeros(4, dtype=CANDLE_DTYPE)
+        candles['close'] = [1.0, 3.0, 5.0, 7.0]
+
+        result = sma(candles['close'], 2)
+
+        numpy.testing.assert_allclose(result[1:], [2.0, 4.0, 6.0])
+
+    def test_sma_window_larger_than_values(self):
+        result = sma(numpy.array([1.0, 2.0]), 3)
+
+        self.assertTrue(numpy.isnan(result).all())
+
+    def test_ema(self):
+        close = numpy.array([1.0, 2.0, 3.0, 4.0])
+
+        result = ema(close, 3)
+
+        self.assertTrue(numpy.isnan(result[:2]).all())
+        numpy.testing.assert_allclose(result[2:], [2.0, 3.0])
+
+    def test_rsi(self):
+        rising = numpy.arange(1.0, 21.0)
+        alternating = numpy.array([1.0, 2.0] * 10)
+
+        rising_rsi = rsi(rising, 14)
+        alternating_rsi = rsi(alternating, 14)
+
+        self.assertTrue(numpy.isnan(rising_rsi[:14]).all())
+        numpy.testing.assert_allclose(rising_rsi[14:], 100.0)
+        self.assertTrue(((alternating_rsi[14:] > 40) & (alternating_rsi[14:] < 60)).all())
+
+    def test_rsi_flat_series_is_neutral(self):
+        flat = numpy.full(20, 5.0)
+
+        flat_rsi = rsi(flat, 14)
+
+        self.assertTrue(numpy.isnan(flat_rsi[:14]).all())
+        numpy.testing.assert_allclose(flat_rsi[14:], 50.0)
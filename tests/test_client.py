@@ -2,11 +2,26 @@
 CoinbaseAdvancedTradeAPIClient unit tests.
 """
 
+import hashlib
+import hmac
+import threading
 import unittest
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from unittest import mock
 
-from coinbaseadvanced.client import CoinbaseAdvancedTradeAPIClient, Side, StopDirection, Granularity
+import orjson
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from coinbaseadvanced.client import CoinbaseAdvancedTradeAPIClient, Side, StopDirection, Granularity, \
+    _RateLimiter, _format_datetime
+from coinbaseadvanced.models.orders import OrderType, OrderPlacementSource
+from coinbaseadvanced.models.products import ProductType
 from coinbaseadvanced.models.error import CoinbaseAdvancedTradeAPIError
 from tests.fixtures.fixtures import \
     fixture_default_failure_response, \
@@ -29,6 +44,7 @@ from tests.fixtures.fixtures import \
     fixture_list_fills_all_call_2_success_response, \
     fixture_get_order_success_response, \
     fixture_list_products_success_response, \
+    fixture_list_products_empty_success_response, \
     fixture_get_product_success_response, \
     fixture_get_product_candles_success_response, \
     fixture_get_product_candles_all_call_1_success_response, \
@@ -49,7 +65,94 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
 
         self.assertIsNotNone(client)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    @mock.patch("coinbaseadvanced.client.requests.Session.close")
+    def test_client_context_manager_closes_session(self, mock_close):
+        with CoinbaseAdvancedTradeAPIClient(
+                api_key='Jk31IAjyWQEG3BfP', secret_key='HUbLt2GsnPOTTkl0t2wkFWn4RrznDJRM') as client:
+            self.assertIsNotNone(client)
+
+        mock_close.assert_called_once()
+
+    def test_create_signature(self):
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        message = b'1676400000GET/api/v3/brokerage/accounts'
+        expected = hmac.new(b'jlsjljsfd89y98y98shdfjksfd', message, hashlib.sha256).hexdigest()
+
+        self.assertEqual(client._create_signature(message), expected)
+
+    @mock.patch("coinbaseadvanced._signing.time.time")
+    def test_build_request_headers_signs_timestamp_method_path_and_body(self, mock_time):
+        mock_time.return_value = 1676400000.5
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        headers = client._build_request_headers('POST', '/api/v3/brokerage/orders', b'{"a": 1}')
+
+        expected = hmac.new(b'jlsjljsfd89y98y98shdfjksfd',
+                            b'1676400000POST/api/v3/brokerage/orders{"a": 1}',
+                            hashlib.sha256).hexdigest()
+
+        self.assertEqual(headers['CB-ACCESS-KEY'], 'kjsldfk32234')
+        self.assertEqual(headers['CB-ACCESS-TIMESTAMP'], '1676400000')
+        self.assertEqual(headers['CB-ACCESS-SIGN'], expected)
+
+    def test_format_datetime(self):
+        self.assertEqual(_format_datetime(datetime(2023, 1, 25)), '2023-01-25T00:00:00Z')
+        self.assertEqual(_format_datetime(datetime(2023, 1, 25, 9, 5, 7, 123456, tzinfo=timezone.utc)),
+                         '2023-01-25T09:05:07Z')
+
+    @mock.patch("coinbaseadvanced.client.time.sleep")
+    def test_rate_limiter_waits_when_burst_exhausted(self, mock_sleep):
+        limiter = _RateLimiter(rate=5, burst=2)
+
+        limiter.acquire()
+        limiter.acquire()
+        mock_sleep.assert_not_called()
+
+        limiter.acquire()
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 0.2, places=2)
+
+    @mock.patch("coinbaseadvanced.client._RateLimiter.acquire")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_requests_are_paced_by_rate_limiter(self, mock_request, mock_acquire):
+
+        mock_request.side_effect = [fixture_get_account_success_response(),
+                                    fixture_cancel_orders_success_response()]
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        client.get_account('b04445c9853222')
+        client.cancel_orders(["order_id_1", "order_id_2"])
+
+        self.assertEqual(mock_acquire.call_count, 2)
+        self.assertEqual([call[0][0] for call in mock_request.call_args_list], ['GET', 'POST'])
+
+    @mock.patch("coinbaseadvanced._signing.time.time")
+    @mock.patch("coinbaseadvanced.client._RateLimiter.acquire")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_requests_are_signed_after_pacing(self, mock_request, mock_acquire, mock_time):
+
+        mock_request.return_value = fixture_get_account_success_response()
+        mock_time.return_value = 1000
+
+        def wait_for_token():
+            mock_time.return_value = 1005
+
+        mock_acquire.side_effect = wait_for_token
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        client.get_account('b04445c9853222')
+
+        self.assertEqual(mock_request.call_args[1]['headers']['CB-ACCESS-TIMESTAMP'], '1005')
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_get_account_success(self, mock_get):
 
         mock_resp = fixture_get_account_success_response()
@@ -93,7 +196,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
         self.assertEqual(account.type, "ACCOUNT_TYPE_CRYPTO")
         self.assertEqual(account.ready, False)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_get_account_failure(self, mock_get):
 
         mock_resp = fixture_default_failure_response()
@@ -111,7 +214,43 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
                 "message": "some additional message here"
             })
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    def test_get_account_retried_server_error_raises_api_error(self):
+
+        with open('tests/fixtures/default_failure_response.json', 'rb') as file:
+            failure_body = file.read()
+
+        received = []
+
+        class FailingHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                received.append(self.path)
+                self.send_response(500)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(failure_body)))
+                self.end_headers()
+                self.wfile.write(failure_body)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), FailingHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        try:
+            with CoinbaseAdvancedTradeAPIClient(
+                    api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd',
+                    base_url=f"http://127.0.0.1:{server.server_port}") as client:
+                with self.assertRaises(CoinbaseAdvancedTradeAPIError) as context:
+                    client.get_account('abc')
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # One request plus three retries, then the last error body is surfaced.
+        self.assertEqual(len(received), 4)
+        self.assertDictEqual(context.exception.error_dict, orjson.loads(failure_body))
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_list_accounts_success(self, mock_get):
 
         mock_resp = fixture_list_accounts_success_response()
@@ -128,7 +267,8 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
 
         for call in call_args:
             args, kwargs = call
-            self.assertIn('https://api.coinbase.com/api/v3/brokerage/accounts?limit=49', args)
+            self.assertIn('https://api.coinbase.com/api/v3/brokerage/accounts', args)
+            self.assertDictEqual(kwargs['params'], {'limit': 49})
 
             headers = kwargs['headers']
             self.assertIn('accept', headers)
@@ -158,7 +298,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIsNotNone(account.hold)
             self.assertIsNotNone(account.ready)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_list_accounts_all_success(self, mock_get):
 
         mock_get.side_effect = [fixture_list_accounts_all_call_1_success_response(),
@@ -191,7 +331,31 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIsNotNone(account.hold)
             self.assertIsNotNone(account.ready)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_iter_accounts_success(self, mock_get):
+
+        mock_get.side_effect = [fixture_list_accounts_all_call_1_success_response(),
+                                fixture_list_accounts_all_call_2_success_response()]
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        accounts = list(client.iter_accounts())
+
+        # Check input
+
+        self.assertEqual(mock_get.call_count, 2)
+
+        # Check output
+
+        self.assertEqual(len(accounts), 98)
+
+        for account in accounts:
+            self.assertIsNotNone(account)
+            self.assertIsNotNone(account.uuid)
+            self.assertIsNotNone(account.name)
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_list_accounts_failure(self, mock_get):
 
         mock_resp = fixture_default_failure_response()
@@ -210,7 +374,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
                 "message": "some additional message here"
             })
 
-    @mock.patch("coinbaseadvanced.client.requests.post")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_create_limit_order_success(self, mock_post):
 
         mock_resp = fixture_create_limit_order_success_response()
@@ -241,7 +405,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIn('CB-ACCESS-TIMESTAMP', headers)
             self.assertIn('CB-ACCESS-SIGN', headers)
 
-            json = kwargs['json']
+            json = orjson.loads(kwargs['data'])
             self.assertEqual(json['client_order_id'], "lknalksdj89asdkl")
             self.assertEqual(json['product_id'], "ALGO-USD")
             self.assertEqual(json['side'], "BUY")
@@ -262,7 +426,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
         self.assertIsNone(order_config_output.stop_limit_stop_limit_gtd)
         self.assertIsNone(order_config_output.market_market_ioc)
 
-    @mock.patch("coinbaseadvanced.client.requests.post")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_create_stop_limit_order_success(self, mock_post):
 
         mock_resp = fixture_create_stop_limit_order_success_response()
@@ -301,7 +465,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIn('CB-ACCESS-TIMESTAMP', headers)
             self.assertIn('CB-ACCESS-SIGN', headers)
 
-            json = kwargs['json']
+            json = orjson.loads(kwargs['data'])
             self.assertEqual(json['client_order_id'], "mklansdu8wehr")
             self.assertEqual(json['product_id'], "ALGO-USD")
             self.assertEqual(json['side'], "BUY")
@@ -323,7 +487,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
         self.assertIsNotNone(order_config_output.stop_limit_stop_limit_gtd)
         self.assertIsNone(order_config_output.market_market_ioc)
 
-    @mock.patch("coinbaseadvanced.client.requests.post")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_create_buy_market_order_success(self, mock_post):
 
         mock_resp = fixture_create_buy_market_order_success_response()
@@ -350,7 +514,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIn('CB-ACCESS-TIMESTAMP', headers)
             self.assertIn('CB-ACCESS-SIGN', headers)
 
-            json = kwargs['json']
+            json = orjson.loads(kwargs['data'])
             self.assertEqual(json['client_order_id'], "asdasd")
             self.assertEqual(json['product_id'], "ALGO-USD")
             self.assertEqual(json['side'], "BUY")
@@ -372,7 +536,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
         self.assertIsNone(order_config_output.stop_limit_stop_limit_gtd)
         self.assertIsNotNone(order_config_output.market_market_ioc)
 
-    @mock.patch("coinbaseadvanced.client.requests.post")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_create_sell_market_order_success(self, mock_post):
 
         mock_resp = fixture_create_sell_market_order_success_response()
@@ -399,7 +563,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIn('CB-ACCESS-TIMESTAMP', headers)
             self.assertIn('CB-ACCESS-SIGN', headers)
 
-            json = kwargs['json']
+            json = orjson.loads(kwargs['data'])
             self.assertEqual(json['client_order_id'], "njkasdh7")
             self.assertEqual(json['product_id'], "ALGO-USD")
             self.assertEqual(json['side'], "SELL")
@@ -421,7 +585,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
         self.assertIsNone(order_config_output.stop_limit_stop_limit_gtd)
         self.assertIsNotNone(order_config_output.market_market_ioc)
 
-    @mock.patch("coinbaseadvanced.client.requests.post")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_create_order_failure(self, mock_post):
 
         mock_resp = fixture_default_order_failure_response()
@@ -458,7 +622,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
                 }
             })
 
-    @mock.patch("coinbaseadvanced.client.requests.post")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_cancel_orders_success(self, mock_post):
 
         mock_resp = fixture_cancel_orders_success_response()
@@ -483,7 +647,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIn('CB-ACCESS-TIMESTAMP', headers)
             self.assertIn('CB-ACCESS-SIGN', headers)
 
-            json = kwargs['json']
+            json = orjson.loads(kwargs['data'])
             self.assertIn('order_id_1', json['order_ids'])
             self.assertIn('order_id_2', json['order_ids'])
 
@@ -493,7 +657,59 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
 
         self.assertEqual(len(cancellation_receipt.results), 2)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    @mock.patch("coinbaseadvanced.client.time.time")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_cancel_orders_signs_sent_body(self, mock_post, mock_time):
+
+        mock_post.return_value = fixture_cancel_orders_success_response()
+        mock_time.return_value = 1676400000
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='lknalksdj89asdkl', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        client.cancel_orders(["order_id_1", "order_id_2"])
+
+        _, kwargs = mock_post.call_args
+        headers = kwargs['headers']
+
+        expected = hmac.new(b'jlsjljsfd89y98y98shdfjksfd',
+                            b'1676400000POST/api/v3/brokerage/orders/batch_cancel/' + kwargs['data'],
+                            hashlib.sha256).hexdigest()
+
+        self.assertEqual(headers['Content-Type'], 'application/json')
+        self.assertEqual(headers['CB-ACCESS-SIGN'], expected)
+        self.assertNotIn('json', kwargs)
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_cancel_orders_splits_large_batches(self, mock_post):
+
+        mock_post.side_effect = lambda *args, **kwargs: fixture_cancel_orders_success_response()
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='lknalksdj89asdkl', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        order_ids = [f"order_id_{i}" for i in range(250)]
+        cancellation_receipt = client.cancel_orders(order_ids)
+
+        # Check input
+
+        self.assertEqual(mock_post.call_count, 3)
+
+        sent_ids = []
+        for call in mock_post.call_args_list:
+            args, kwargs = call
+            self.assertIn('https://api.coinbase.com/api/v3/brokerage/orders/batch_cancel/', args)
+            body = orjson.loads(kwargs['data'])
+            self.assertLessEqual(len(body['order_ids']), 100)
+            sent_ids.extend(body['order_ids'])
+
+        self.assertCountEqual(sent_ids, order_ids)
+
+        # Check output
+
+        self.assertEqual(len(cancellation_receipt.results), 6)
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_list_orders_success(self, mock_get):
 
         mock_resp = fixture_list_orders_success_response()
@@ -512,9 +728,12 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
 
         for call in call_args:
             args, kwargs = call
-            self.assertIn(
-                'https://api.coinbase.com/api/v3/brokerage/orders/historical/batch?limit=10&start_date=2023-01-25T00:00:00Z&end_date=2023-01-30T00:00:00Z',
-                args)
+            self.assertIn('https://api.coinbase.com/api/v3/brokerage/orders/historical/batch', args)
+            self.assertDictEqual(kwargs['params'], {
+                'limit': 10,
+                'start_date': '2023-01-25T00:00:00Z',
+                'end_date': '2023-01-30T00:00:00Z'
+            })
 
             headers = kwargs['headers']
             self.assertIn('accept', headers)
@@ -541,7 +760,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIsNotNone(order.settled)
             self.assertIsNotNone(order.filled_size)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_list_orders_with_extra_unnamed_arg_success(self, mock_get):
 
         mock_resp = fixture_list_orders_with_extra_unnamed_success_response()
@@ -560,9 +779,12 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
 
         for call in call_args:
             args, kwargs = call
-            self.assertIn(
-                'https://api.coinbase.com/api/v3/brokerage/orders/historical/batch?limit=10&start_date=2023-01-25T00:00:00Z&end_date=2023-01-30T00:00:00Z',
-                args)
+            self.assertIn('https://api.coinbase.com/api/v3/brokerage/orders/historical/batch', args)
+            self.assertDictEqual(kwargs['params'], {
+                'limit': 10,
+                'start_date': '2023-01-25T00:00:00Z',
+                'end_date': '2023-01-30T00:00:00Z'
+            })
 
             headers = kwargs['headers']
             self.assertIn('accept', headers)
@@ -592,7 +814,34 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIsNotNone(order.settled)
             self.assertIsNotNone(order.filled_size)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_list_orders_with_filters_builds_params(self, mock_get):
+
+        mock_resp = fixture_list_orders_success_response()
+        mock_get.return_value = mock_resp
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        client.list_orders(product_id='ALGO-USD',
+                           order_status=['OPEN', 'FILLED'],
+                           order_type=OrderType.LIMIT,
+                           order_side=Side.BUY,
+                           product_type=ProductType.SPOT,
+                           order_placement_source=OrderPlacementSource.RETAIL_ADVANCDED)
+
+        _, kwargs = mock_get.call_args
+        self.assertDictEqual(kwargs['params'], {
+            'product_id': 'ALGO-USD',
+            'order_status': 'OPEN,FILLED',
+            'limit': 999,
+            'order_type': 'LIMIT',
+            'order_side': 'BUY',
+            'product_type': 'SPOT',
+            'order_placement_source': 'RETAIL_ADVANCED',
+        })
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_list_orders_all_success(self, mock_get):
 
         mock_get.side_effect = [
@@ -626,7 +875,58 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIsNotNone(order.settled)
             self.assertIsNotNone(order.filled_size)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_iter_orders_success(self, mock_get):
+
+        mock_get.side_effect = [
+            fixture_list_orders_all_call_1_success_response(),
+            fixture_list_orders_all_call_2_success_response()
+        ]
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        orders = list(client.iter_orders(start_date=datetime(2023, 1, 25),
+                                         end_date=datetime(2023, 1, 30),
+                                         limit=10))
+
+        # Check input
+
+        self.assertEqual(mock_get.call_count, 2)
+
+        # Check output
+
+        self.assertEqual(len(orders), 20)
+
+        for order in orders:
+            self.assertIsNotNone(order)
+            self.assertIsNotNone(order.order_id)
+            self.assertIsNotNone(order.product_id)
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_iter_orders_stopped_early_cancels_prefetch(self, mock_get):
+
+        mock_get.side_effect = [
+            fixture_list_orders_all_call_1_success_response(),
+            fixture_list_orders_all_call_2_success_response()
+        ]
+
+        release = threading.Event()
+
+        with CoinbaseAdvancedTradeAPIClient(
+                api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd', max_workers=1) as client:
+            # Keep the only worker busy so the prefetch stays queued.
+            client._executor.submit(release.wait)
+
+            orders = client.iter_orders(limit=10)
+            next(orders)
+            orders.close()
+
+            release.set()
+
+        self.assertEqual(mock_get.call_count, 1)
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_list_fills_success(self, mock_get):
 
         mock_resp = fixture_list_fills_success_response()
@@ -645,9 +945,12 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
 
         for call in call_args:
             args, kwargs = call
-            self.assertIn(
-                'https://api.coinbase.com/api/v3/brokerage/orders/historical/fills?limit=5&start_date=2023-01-20T00:00:00Z&end_date=2023-01-30T00:00:00Z',
-                args)
+            self.assertIn('https://api.coinbase.com/api/v3/brokerage/orders/historical/fills', args)
+            self.assertDictEqual(kwargs['params'], {
+                'limit': 5,
+                'start_date': '2023-01-20T00:00:00Z',
+                'end_date': '2023-01-30T00:00:00Z'
+            })
 
             headers = kwargs['headers']
             self.assertIn('accept', headers)
@@ -673,7 +976,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIsNotNone(fill.size)
             self.assertIsNotNone(fill.trade_id)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_list_fills_all_success(self, mock_get):
 
         mock_get.side_effect = [fixture_list_fills_all_call_1_success_response(),
@@ -705,7 +1008,34 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIsNotNone(fill.size)
             self.assertIsNotNone(fill.trade_id)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_iter_fills_success(self, mock_get):
+
+        mock_get.side_effect = [fixture_list_fills_all_call_1_success_response(),
+                                fixture_list_fills_all_call_2_success_response()
+                                ]
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        fills = list(client.iter_fills(limit=5,
+                                       start_date=datetime(2023, 1, 20),
+                                       end_date=datetime(2023, 1, 30)))
+
+        # Check input
+
+        self.assertEqual(mock_get.call_count, 2)
+
+        # Check output
+
+        self.assertEqual(len(fills), 10)
+
+        for fill in fills:
+            self.assertIsNotNone(fill)
+            self.assertIsNotNone(fill.order_id)
+            self.assertIsNotNone(fill.trade_id)
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_get_order_success(self, mock_get):
 
         mock_resp = fixture_get_order_success_response()
@@ -746,7 +1076,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
         self.assertIsNotNone(order.order_configuration)
         self.assertIsNotNone(order.order_type)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_list_products_success(self, mock_get):
 
         mock_resp = fixture_list_products_success_response()
@@ -763,9 +1093,8 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
 
         for call in call_args:
             args, kwargs = call
-            self.assertIn(
-                'https://api.coinbase.com/api/v3/brokerage/products?limit=5',
-                args)
+            self.assertIn('https://api.coinbase.com/api/v3/brokerage/products', args)
+            self.assertDictEqual(kwargs['params'], {'limit': 5})
 
             headers = kwargs['headers']
             self.assertIn('accept', headers)
@@ -790,7 +1119,74 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIsNotNone(product.watched)
             self.assertIsNotNone(product.price_percentage_change_24h)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+            # Slotted models keep no per-instance dict of unknown fields.
+            self.assertFalse(hasattr(product, '__dict__'))
+            self.assertFalse(hasattr(product, 'kwargs'))
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_iter_products_success(self, mock_get):
+
+        def fake_get(method, url, **kwargs):
+            if kwargs['params']['offset'] == 0:
+                return fixture_list_products_success_response()
+            return fixture_list_products_empty_success_response()
+
+        mock_get.side_effect = fake_get
+
+        # Closing the client waits for speculative requests still running.
+        with CoinbaseAdvancedTradeAPIClient(
+                api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd') as client:
+            products = list(client.iter_products(limit=5, workers=2))
+
+        # Check input
+
+        offsets = sorted(call[1]['params']['offset'] for call in mock_get.call_args_list)
+        # The window may have queued the page after the last one before it was read.
+        self.assertIn(offsets, ([0, 5], [0, 5, 10]))
+
+        # Check output
+
+        self.assertEqual(len(products), 5)
+
+        for product in products:
+            self.assertIsNotNone(product)
+            self.assertIsNotNone(product.product_id)
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_iter_products_ignores_errors_past_last_page(self, mock_get):
+
+        def fake_get(method, url, **kwargs):
+            offset = kwargs['params']['offset']
+            if offset == 0:
+                return fixture_list_products_success_response()
+            if offset == 5:
+                return fixture_list_products_empty_success_response()
+            return fixture_default_failure_response()
+
+        mock_get.side_effect = fake_get
+
+        with CoinbaseAdvancedTradeAPIClient(
+                api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd') as client:
+            products = list(client.iter_products(limit=5, workers=4))
+
+        offsets = sorted(call[1]['params']['offset'] for call in mock_get.call_args_list)
+        self.assertEqual(offsets[:2], [0, 5])
+        self.assertTrue(set(offsets) <= {0, 5, 10, 15, 20})
+
+        self.assertEqual(len(products), 5)
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_iter_products_rejects_non_positive_limit(self, mock_get):
+
+        with CoinbaseAdvancedTradeAPIClient(
+                api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd') as client:
+            for limit in (0, -1, None):
+                with self.assertRaises(ValueError):
+                    next(client.iter_products(limit=limit))
+
+        mock_get.assert_not_called()
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_get_product_success(self, mock_get):
 
         mock_resp = fixture_get_product_success_response()
@@ -828,7 +1224,144 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
         self.assertIsNotNone(product.watched)
         self.assertIsNotNone(product.price_percentage_change_24h)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_get_product_ignores_unknown_fields(self, mock_get):
+
+        mock_resp = fixture_get_product_success_response()
+        result = orjson.loads(mock_resp.content)
+        result['new_api_field'] = 'value'
+        mock_resp.content = orjson.dumps(result)
+        mock_get.return_value = mock_resp
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        product = client.get_product('BTC-USD')
+
+        self.assertEqual(product.product_id, result['product_id'])
+        self.assertFalse(hasattr(product, 'new_api_field'))
+
+        # Models keep identity equality and hashing.
+        self.assertIn(product, {product})
+        self.assertNotEqual(product, client.get_product('BTC-USD'))
+
+    @mock.patch("coinbaseadvanced.client.time.monotonic")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_get_product_is_cached(self, mock_get, mock_monotonic):
+
+        mock_get.side_effect = lambda *args, **kwargs: fixture_get_product_success_response()
+        mock_monotonic.return_value = 1000
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd', products_cache_ttl=60)
+
+        client.get_product('BTC-USD')
+        client.get_product('BTC-USD')
+        self.assertEqual(mock_get.call_count, 1)
+
+        client.get_product('ETH-USD')
+        self.assertEqual(mock_get.call_count, 2)
+
+        # Entries expire after the products TTL.
+        mock_monotonic.return_value = 1061
+        client.get_product('BTC-USD')
+        self.assertEqual(mock_get.call_count, 3)
+
+        client.clear_cache()
+        client.get_product('BTC-USD')
+        self.assertEqual(mock_get.call_count, 4)
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_get_product_is_not_cached_by_default(self, mock_get):
+
+        mock_get.side_effect = [fixture_get_product_success_response(),
+                                fixture_get_product_success_response(),
+                                fixture_list_products_success_response(),
+                                fixture_list_products_success_response()]
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        # Live prices are never served from the cache unless a products TTL is set.
+        client.get_product('BTC-USD')
+        client.get_product('BTC-USD')
+        client.list_products()
+        client.list_products()
+        self.assertEqual(mock_get.call_count, 4)
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_cache_size_zero_disables_cache(self, mock_get):
+
+        mock_get.side_effect = lambda *args, **kwargs: fixture_get_product_success_response()
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd',
+            cache_size=0, products_cache_ttl=60)
+
+        client.get_product('BTC-USD')
+        client.get_product('BTC-USD')
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(len(client._cache), 0)
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_get_product_failure_is_not_cached(self, mock_get):
+
+        mock_get.side_effect = [fixture_default_failure_response(), fixture_get_product_success_response()]
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        with self.assertRaises(CoinbaseAdvancedTradeAPIError):
+            client.get_product('BTC-USD')
+
+        product = client.get_product('BTC-USD')
+        self.assertIsNotNone(product)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_get_product_candles_closed_range_is_cached(self, mock_get):
+
+        mock_get.side_effect = lambda *args, **kwargs: fixture_get_product_candles_success_response()
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        for _ in range(2):
+            client.get_product_candles(
+                "ALGO-USD", start_date=datetime(2023, 1, 1, tzinfo=timezone.utc),
+                end_date=datetime(2023, 1, 31, tzinfo=timezone.utc),
+                granularity=Granularity.ONE_DAY)
+
+        self.assertEqual(mock_get.call_count, 1)
+
+        # Candles still forming are always requested.
+        for _ in range(2):
+            client.get_product_candles(
+                "ALGO-USD", start_date=datetime(2023, 1, 1, tzinfo=timezone.utc),
+                end_date=datetime.now(timezone.utc),
+                granularity=Granularity.ONE_DAY)
+
+        self.assertEqual(mock_get.call_count, 3)
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_get_product_candles_accepts_granularity_name(self, mock_get):
+
+        mock_get.side_effect = lambda *args, **kwargs: fixture_get_product_candles_success_response()
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        for granularity in (Granularity.ONE_DAY, "ONE_DAY"):
+            client.get_product_candles(
+                "ALGO-USD", start_date=datetime(2023, 1, 1, tzinfo=timezone.utc),
+                end_date=datetime(2023, 1, 31, tzinfo=timezone.utc),
+                granularity=granularity)
+
+        # Both spellings send the same query and share the cache entry.
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(mock_get.call_args[1]['params']['granularity'], 'ONE_DAY')
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_get_product_candles(self, mock_get):
 
         mock_resp = fixture_get_product_candles_success_response()
@@ -848,9 +1381,12 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
 
         for call in call_args:
             args, kwargs = call
-            self.assertIn(
-                'https://api.coinbase.com/api/v3/brokerage/products/ALGO-USD/candles?start=1672531200&end=1675123200&granularity=ONE_DAY',
-                args)
+            self.assertIn('https://api.coinbase.com/api/v3/brokerage/products/ALGO-USD/candles', args)
+            self.assertDictEqual(kwargs['params'], {
+                'start': 1672531200,
+                'end': 1675123200,
+                'granularity': 'ONE_DAY'
+            })
 
             headers = kwargs['headers']
             self.assertIn('accept', headers)
@@ -874,7 +1410,57 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIsNotNone(candle.close)
             self.assertIsNotNone(candle.volume)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_get_product_candles_as_array(self, mock_get):
+
+        mock_resp = fixture_get_product_candles_success_response()
+        mock_get.return_value = mock_resp
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        product_candles = client.get_product_candles(
+            "ALGO-USD", start_date=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2023, 1, 31, tzinfo=timezone.utc),
+            granularity=Granularity.ONE_DAY,
+            as_array=True)
+
+        # Check output
+
+        self.assertIsNone(product_candles.candles)
+
+        candles = product_candles.as_numpy()
+        self.assertIs(candles, product_candles.candles_array)
+        self.assertEqual(len(candles), 30)
+        self.assertEqual(candles['start'][0], 1675123200)
+        self.assertAlmostEqual(candles['low'][0], 0.235)
+        self.assertAlmostEqual(candles['volume'][0], 28515145.3)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
+    def test_get_product_candles_as_numpy_from_candles(self, mock_get):
+
+        mock_resp = fixture_get_product_candles_success_response()
+        mock_get.return_value = mock_resp
+
+        client = CoinbaseAdvancedTradeAPIClient(
+            api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd')
+
+        product_candles = client.get_product_candles(
+            "ALGO-USD", start_date=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2023, 1, 31, tzinfo=timezone.utc),
+            granularity=Granularity.ONE_DAY)
+
+        # Check output
+
+        candles = product_candles.as_numpy()
+        self.assertEqual(len(candles), len(product_candles.candles))
+        self.assertEqual(candles['start'][0], int(product_candles.candles[0].start))
+        self.assertAlmostEqual(candles['close'][0], float(product_candles.candles[0].close))
+
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_get_product_candles_all(self, mock_get):
 
         mock_get.side_effect = [
@@ -912,7 +1498,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIsNotNone(candle.close)
             self.assertIsNotNone(candle.volume)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_get_trades(self, mock_get):
 
         mock_resp = fixture_get_trades_success_response()
@@ -929,9 +1515,8 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
 
         for call in call_args:
             args, kwargs = call
-            self.assertIn(
-                'https://api.coinbase.com/api/v3/brokerage/products/BTC-USD/ticker?limit=100',
-                args)
+            self.assertIn('https://api.coinbase.com/api/v3/brokerage/products/BTC-USD/ticker', args)
+            self.assertDictEqual(kwargs['params'], {'limit': 100})
 
             headers = kwargs['headers']
             self.assertIn('accept', headers)
@@ -951,7 +1536,7 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
             self.assertIsNotNone(trade.time)
             self.assertIsNotNone(trade.trade_id)
 
-    @mock.patch("coinbaseadvanced.client.requests.get")
+    @mock.patch("coinbaseadvanced.client.requests.Session.request")
     def test_get_transactions_summary(self, mock_get):
 
         mock_resp = fixture_get_transactions_summary_success_response()
@@ -970,9 +1555,12 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
 
         for call in call_args:
             args, kwargs = call
-            self.assertIn(
-                'https://api.coinbase.com/api/v3/brokerage/transaction_summary?start_date=2023-01-01T00:00:00Z&end_date=2023-01-31T00:00:00Z&user_native_currency=USD',
-                args)
+            self.assertIn('https://api.coinbase.com/api/v3/brokerage/transaction_summary', args)
+            self.assertDictEqual(kwargs['params'], {
+                'start_date': '2023-01-01T00:00:00Z',
+                'end_date': '2023-01-31T00:00:00Z',
+                'user_native_currency': 'USD'
+            })
 
             headers = kwargs['headers']
             self.assertIn('accept', headers)
@@ -986,3 +1574,10 @@ class TestCoinbaseAdvancedTradeAPIClient(unittest.TestCase):
         self.assertIsNotNone(transactions_summary.fee_tier)
         self.assertIsNotNone(transactions_summary.total_fees)
         self.assertIsNotNone(transactions_summary.total_volume)
+
+        self.assertEqual(transactions_summary.fee_tier.maker_fee_rate, "0.004")
+        self.assertIsNone(transactions_summary.margin_rate)
+        self.assertIsNone(transactions_summary.goods_and_services_tax)
+
+        with self.assertRaises(FrozenInstanceError):
+            transactions_summary.total_fees = 0
@@ -0,0 +1,228 @@
+"""
+AsyncCoinbaseAdvancedTradeAPIClient unit tests.
+"""
+
+import asyncio
+import json
+import unittest
+from datetime import datetime
+from unittest import mock
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from coinbaseadvanced.models.error import CoinbaseAdvancedTradeAPIError
+from coinbaseadvanced.models.orders import Side
+from tests.fixtures.fixtures import \
+    fixture_default_failure_response, \
+    fixture_get_account_success_response, \
+    fixture_get_product_success_response, \
+    fixture_create_limit_order_success_response, \
+    fixture_create_buy_market_order_success_response, \
+    fixture_list_orders_success_response
+
+if httpx is not None:
+    from coinbaseadvanced.client_async import AsyncCoinbaseAdvancedTradeAPIClient, _AsyncRateLimiter
+
+
+def httpx_response(fixture) -> 'httpx.Response':
+    """
+    Turn a `requests` style fixture into the equivalent `httpx.Response`.
+    """
+
+    return httpx.Response(200 if fixture.ok else 400, content=fixture.content)
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncCoinbaseAdvancedTradeAPIClient(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for AsyncCoinbaseAdvancedTradeAPIClient.
+    """
+
+    async def test_client_context_manager_closes_connections(self):
+        async with AsyncCoinbaseAdvancedTradeAPIClient(
+                api_key='Jk31IAjyWQEG3BfP', secret_key='HUbLt2GsnPOTTkl0t2wkFWn4RrznDJRM') as client:
+            self.assertIsNotNone(client)
+
+        self.assertTrue(client._client.is_closed)
+
+    @mock.patch("coinbaseadvanced.client_async.httpx.AsyncClient.get", new_callable=mock.AsyncMock)
+    async def test_get_account_success(self, mock_get):
+
+        mock_get.return_value = httpx_response(fixture_get_account_success_response())
+
+        async with AsyncCoinbaseAdvancedTradeAPIClient(
+                api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd') as client:
+            account = await client.get_account('b04445c9853222')
+
+        # Check input
+
+        args, kwargs = mock_get.call_args
+        self.assertIn('/api/v3/brokerage/accounts/b04445c9853222', args)
+
+        headers = kwargs['headers']
+        self.assertIn('accept', headers)
+        self.assertIn('CB-ACCESS-KEY', headers)
+        self.assertIn('CB-ACCESS-TIMESTAMP', headers)
+        self.assertIn('CB-ACCESS-SIGN', headers)
+
+        # Check output
+
+        self.assertEqual(account.name, "BTC Wallet")
+        self.assertEqual(account.uuid, "b044449a-38a3-5b8f-a506-4a65c9853222")
+
+    @mock.patch("coinbaseadvanced.client_async.httpx.AsyncClient.get", new_callable=mock.AsyncMock)
+    async def test_get_account_failure(self, mock_get):
+
+        mock_get.return_value = httpx_response(fixture_default_failure_response())
+
+        async with AsyncCoinbaseAdvancedTradeAPIClient(
+                api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd') as client:
+            with self.assertRaises(CoinbaseAdvancedTradeAPIError) as context:
+                await client.get_account('b04445c9853222')
+
+        self.assertDictEqual(context.exception.error_dict, {
+            "error": "unknown",
+            "error_details": "some error details here",
+            "message": "some additional message here"
+        })
+
+    @mock.patch("coinbaseadvanced.client_async._retry_delay", return_value=0)
+    @mock.patch("coinbaseadvanced.client_async.httpx.AsyncClient.get", new_callable=mock.AsyncMock)
+    async def test_get_account_retries_server_errors(self, mock_get, mock_retry_delay):
+
+        failure = fixture_default_failure_response()
+        mock_get.side_effect = [httpx.Response(503, content=failure.content),
+                                httpx_response(fixture_get_account_success_response())]
+
+        async with AsyncCoinbaseAdvancedTradeAPIClient(
+                api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd') as client:
+            account = await client.get_account('b04445c9853222')
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(account.name, "BTC Wallet")
+
+    @mock.patch("coinbaseadvanced.client_async._retry_delay", return_value=0)
+    @mock.patch("coinbaseadvanced.client_async.httpx.AsyncClient.get", new_callable=mock.AsyncMock)
+    async def test_get_account_retries_exhausted_raises_api_error(self, mock_get, mock_retry_delay):
+
+        failure = fixture_default_failure_response()
+        mock_get.side_effect = lambda *args, **kwargs: httpx.Response(500, content=failure.content)
+
+        async with AsyncCoinbaseAdvancedTradeAPIClient(
+                api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd') as client:
+            with self.assertRaises(CoinbaseAdvancedTradeAPIError):
+                await client.get_account('b04445c9853222')
+
+        # One request plus three retries.
+        self.assertEqual(mock_get.call_count, 4)
+
+    @mock.patch("coinbaseadvanced.client_async.asyncio.sleep", new_callable=mock.AsyncMock)
+    async def test_rate_limiter_waits_when_burst_exhausted(self, mock_sleep):
+        limiter = _AsyncRateLimiter(rate=5, burst=2)
+
+        await limiter.acquire()
+        await limiter.acquire()
+        mock_sleep.assert_not_called()
+
+        await limiter.acquire()
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 0.2, places=2)
+
+    @mock.patch("coinbaseadvanced.client_async._AsyncRateLimiter.acquire", new_callable=mock.AsyncMock)
+    @mock.patch("coinbaseadvanced.client_async.httpx.AsyncClient.get", new_callable=mock.AsyncMock)
+    async def test_get_product_concurrently(self, mock_get, mock_acquire):
+
+        mock_get.side_effect = lambda *args, **kwargs: httpx_response(fixture_get_product_success_response())
+
+        async with AsyncCoinbaseAdvancedTradeAPIClient(
+                api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd') as client:
+            products = await asyncio.gather(*[client.get_product(p) for p in ['BTC-USD', 'ETH-USD']])
+
+        # Check input
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_acquire.call_count, 2)
+
+        # Check output
+
+        self.assertEqual(len(products), 2)
+        for product in products:
+            self.assertIsNotNone(product.product_id)
+
+    @mock.patch("coinbaseadvanced.client_async.httpx.AsyncClient.get", new_callable=mock.AsyncMock)
+    async def test_list_orders_success(self, mock_get):
+
+        mock_get.return_value = httpx_response(fixture_list_orders_success_response())
+
+        async with AsyncCoinbaseAdvancedTradeAPIClient(
+                api_key='kjsldfk32234', secret_key='jlsjljsfd89y98y98shdfjksfd') as client:
+            orders_page = await client.list_orders(start_date=datetime(2023, 1, 25),
+                                                   end_date=datetime(2023, 1, 30),
+                                                   limit=10)
+
+        # Check input
+
+        args, kwargs = mock_get.call_args
+        self.assertIn('/api/v3/brokerage/orders/historical/batch', args)
+        self.assertDictEqual(kwargs['params'], {
+            'limit': 10,
+            'start_date': '2023-01-25T00:00:00Z',
+            'end_date': '2023-01-30T00:00:00Z'
+        })
+
+        # Check output
+
+        self.assertIsNotNone(orders_page)
+        for order in orders_page:
+            self.assertIsNotNone(order.order_id)
+
+    @mock.patch("coinbaseadvanced.client_async.httpx.AsyncClient.post", new_callable=mock.AsyncMock)
+    async def test_create_order_success(self, mock_post):
+
+        mock_post.return_value = httpx_response(fixture_create_limit_order_success_response())
+
+        order_config = {'limit_limit_gtc': {'limit_price': '0.19', 'base_size': '5'}}
+
+        async with AsyncCoinbaseAdvancedTradeAPIClient(
+                api_key='lknalksdj89asdkl', secret_key='jlsjljsfd89y98y98shdfjksfd') as client:
+            order_created = await client.create_order("lknalksdj89asdkl", "ALGO-USD", Side.BUY, order_config)
+
+        # Check input
+
+        args, kwargs = mock_post.call_args
+        self.assertIn('/api/v3/brokerage/orders', args)
+
+        headers = kwargs['headers']
+        self.assertEqual(headers['Content-Type'], 'application/json')
+        self.assertIn('CB-ACCESS-SIGN', headers)
+
+        body = json.loads(kwargs['content'])
+        self.assertEqual(body['client_order_id'], "lknalksdj89asdkl")
+        self.assertEqual(body['side'], "BUY")
+        self.assertDictEqual(body['order_configuration'], order_config)
+
+        # Check output
+
+        self.assertEqual(order_created.order_id, "07f1e718-8ea8-4ece-a2e1-3f00aad7f040")
+
+    @mock.patch("coinbaseadvanced.client_async.httpx.AsyncClient.post", new_callable=mock.AsyncMock)
+    async def test_create_buy_market_order_success(self, mock_post):
+
+        mock_post.return_value = httpx_response(fixture_create_buy_market_order_success_response())
+
+        async with AsyncCoinbaseAdvancedTradeAPIClient(
+                api_key='lknalksdj89asdkl', secret_key='jlsjljsfd89y98y98shdfjksfd') as client:
+            order_created = await client.create_buy_market_order("lknalksdj89asdkl", "ALGO-USD", 1)
+
+        # Check input
+
+        body = json.loads(mock_post.call_args[1]['content'])
+        self.assertEqual(body['side'], "BUY")
+        self.assertDictEqual(body['order_configuration'], {'market_market_ioc': {'quote_size': '1'}})
+
+        # Check output
+
+        self.assertIsNotNone(order_created.order_id)